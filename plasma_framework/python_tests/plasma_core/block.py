@@ -1,58 +1,153 @@
+from collections import OrderedDict
+
 import rlp
+from rlp.codec import length_prefix
 from rlp.sedes import CountableList, big_endian_int
-from eth_utils import keccak
+from plasma_core.utils import ecdsa
+from plasma_core.utils.keccak import keccak
 from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from plasma_core.utils.merkle.incremental_merkle import IncrementalMerkle
 from plasma_core.transaction import Transaction
 from plasma_core.constants import NULL_SIGNATURE
+from plasma_core.exceptions import BlockSealedException
+
+MERKLE_CACHE_SIZE = 32
+LIST_PREFIX_OFFSET = 0xc0
+
+
+class MerkleCache(object):
+    """Bounded LRU cache of Merkle trees of blocks.
+
+    Blocks are immutable, so trees are keyed by block identity. A cached entry keeps its block alive,
+    hence the id of the block cannot be reused while the entry is in the cache.
+    """
+
+    def __init__(self, max_size=MERKLE_CACHE_SIZE):
+        self.max_size = max_size
+        self._trees = OrderedDict()
+
+    def get(self, block):
+        entry = self._trees.get(id(block))
+        if entry is None or entry[0] is not block:
+            return None
+        self._trees.move_to_end(id(block))
+        return entry[1]
+
+    def put(self, block, merkle):
+        self._trees[id(block)] = (block, merkle)
+        self._trees.move_to_end(id(block))
+        while len(self._trees) > self.max_size:
+            self._trees.popitem(last=False)
+
+    def clear(self):
+        self._trees.clear()
+
+
+merkle_cache = MerkleCache()
 
 
 class Block(rlp.Serializable):
+    MERKLE_DEPTH = 16
 
     fields = (
         ('transactions', CountableList(Transaction)),
         ('number', big_endian_int),
     )
 
-    def __init__(self, transactions=None, number=0):
+    def __init__(self, transactions=None, number=0, root=None, block_hash=None):
         if transactions is None:
             transactions = []
         super().__init__(transactions, number)
+        # transactions of a block cannot change, so its root and hash are computed once
+        self._root = root
+        self._hash = block_hash
 
     @property
     def hash(self):
-        return keccak(self.encoded)
+        if self._hash is None:
+            self._hash = keccak(self.encoded)
+        return self._hash
 
     @property
     def merklized_transaction_set(self):
-        encoded_transactions = [tx.encoded for tx in self.transactions]
-        return FixedMerkle(16, encoded_transactions)
+        merkle = merkle_cache.get(self)
+        if merkle is None:
+            encoded_transactions = [tx.encoded for tx in self.transactions]
+            merkle = FixedMerkle(self.MERKLE_DEPTH, encoded_transactions)
+            merkle_cache.put(self, merkle)
+            self._root = merkle.root
+        return merkle
+
+    def create_membership_proofs(self, indices=None):
+        """ Creates inclusion proofs of the transactions at the given indices, or of all transactions """
+        return self.merklized_transaction_set.create_membership_proofs(indices)
 
     @property
     def root(self):
-        return self.merklized_transaction_set.root
+        if self._root is None:
+            self._root = self.merklized_transaction_set.root
+        return self._root
 
     @property
     def encoded(self):
-        return rlp.encode(self)
+        # transactions cache their encodings, so the block is assembled from them instead of being serialized anew
+        if self._cached_rlp is None:
+            transactions = b''.join(tx.encoded for tx in self.transactions)
+            payload = length_prefix(len(transactions), LIST_PREFIX_OFFSET) + transactions + rlp.encode(self.number)
+            self._cached_rlp = length_prefix(len(payload), LIST_PREFIX_OFFSET) + payload
+        return self._cached_rlp
 
     @property
     def is_deposit_block(self):
         return len(self.transactions) == 1 and self.transactions[0].is_deposit
 
     def sign(self, key):
-        return SignedBlock(self, key.sign_msg_hash(self.hash))
+        return SignedBlock(self, ecdsa.sign(self.hash, key))
 
 
 class SignedBlock(Block):
 
     def __init__(self, block, signature=NULL_SIGNATURE):
-        super().__init__(block.transactions, block.number)
+        super().__init__(block.transactions, block.number, root=block._root, block_hash=block._hash)
         self._signature = signature
 
+        merkle = merkle_cache.get(block)
+        if merkle is not None:
+            merkle_cache.put(self, merkle)
+
     @property
     def signature(self):
         return self._signature.to_bytes()
 
     @property
     def signer(self):
-        return self._signature.recover_public_key_from_msg_hash(self.hash).to_checksum_address()
+        return ecdsa.recover_public_key(self.hash, self._signature).to_checksum_address()
+
+
+class BlockBuilder(object):
+    """Accumulates transactions of a block under construction.
+
+    The Merkle root is kept up to date incrementally, so it is available at any point
+    without rebuilding the tree. Sealing the builder produces the immutable Block,
+    after which no more transactions can be added.
+    """
+
+    def __init__(self, number=0):
+        self.number = number
+        self.transactions = []
+        self.merkle = IncrementalMerkle(Block.MERKLE_DEPTH)
+        self.sealed = False
+
+    def add_transaction(self, tx):
+        if self.sealed:
+            raise BlockSealedException('cannot add a transaction to a sealed block')
+        self.merkle.append(tx.encoded)
+        self.transactions.append(tx)
+
+    @property
+    def root(self):
+        return self.merkle.root
+
+    def seal(self):
+        self.sealed = True
+        return Block(self.transactions, number=self.number, root=self.root)
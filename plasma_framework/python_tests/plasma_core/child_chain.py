@@ -8,8 +8,12 @@ from plasma_core.exceptions import (InvalidBlockSignatureException,
 
 class ChildChain(object):
 
-    def __init__(self, operator):
+    def __init__(self, operator, proof_store=None, archive=None, signer_recovery=None):
         self.operator = operator
+        self.proof_store = proof_store
+        self.archive = archive
+        # when set, signers of transactions are recovered from their signatures instead of trusting tx.signers
+        self.signer_recovery = signer_recovery
         self.blocks = {}
         self.parent_queue = {}
         self.child_block_interval = CHILD_BLOCK_INTERVAL
@@ -53,9 +57,11 @@ class ChildChain(object):
             del self.parent_queue[block.number]
         return True
 
-    def validate_transaction(self, tx, temp_spent=None):
+    def validate_transaction(self, tx, temp_spent=None, signers=None):
         if not temp_spent:
             temp_spent = dict()
+        if signers is None:
+            signers = self.__signers([tx])[0]
 
         input_amount = 0
         output_amount = sum([o.amount for o in tx.outputs])
@@ -71,7 +77,7 @@ class ChildChain(object):
 
             # Check for a valid signature.
             output_guard = input_tx.outputs[i.oindex].output_guard
-            if tx.signatures[x] == NULL_SIGNATURE or tx.signers[x] != output_guard:
+            if tx.signatures[x] == NULL_SIGNATURE or signers[x] != output_guard:
                 raise InvalidTxSignatureException('failed to validate tx')
 
             # Check to see if the input is already spent.
@@ -104,11 +110,20 @@ class ChildChain(object):
         if not block.is_deposit_block and (block.signature == NULL_SIGNATURE or block.signer != self.operator.address):
             raise InvalidBlockSignatureException('failed to validate block')
 
-        # Validate each transaction in the block.
-        for tx in block.transactions:
-            self.validate_transaction(tx)
+        # Validate each transaction in the block, with signers of the whole block recovered in one batch.
+        for tx, signers in zip(block.transactions, self.__signers(block.transactions)):
+            self.validate_transaction(tx, signers=signers)
+
+    def __signers(self, transactions):
+        if self.signer_recovery is None:
+            return [tx.signers for tx in transactions]
+        return self.signer_recovery.recover_transactions(transactions)
 
     def __apply_block(self, block):
         for tx in block.transactions:
             self.__apply_transaction(tx)
         self.blocks[block.number] = block
+        if self.proof_store is not None:
+            self.proof_store.write(block.number, block.merklized_transaction_set)
+        if self.archive is not None:
+            self.archive.append(block)
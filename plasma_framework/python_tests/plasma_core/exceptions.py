@@ -16,3 +16,7 @@ class TxAmountMismatchException(Exception):
 
 class InvalidBlockMerkleException(Exception):
     """merkle tree of a block is invalid"""
+
+
+class BlockSealedException(Exception):
+    """transactions cannot be added to a sealed block"""
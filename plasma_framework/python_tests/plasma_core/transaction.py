@@ -1,11 +1,14 @@
 import enum
 
 import rlp
-from eth_utils import address, keccak
 from rlp.sedes import big_endian_int, CountableList, Binary, List
 
 from plasma_core.constants import NULL_SIGNATURE, NULL_ADDRESS, EMPTY_METADATA
+from plasma_core.utils import ecdsa
+from plasma_core.utils.addresses import canonical_address
 from plasma_core.utils.eip712_struct_hash import hash_struct
+from plasma_core.utils.keccak import keccak
+from plasma_core.utils.payment_encoding import encode_transaction
 from plasma_core.utils.transactions import encode_utxo_id
 
 
@@ -18,10 +21,32 @@ class TxOutputTypes(enum.Enum):
 
 
 class TransactionInput:
+    """Position of a spent output.
+
+    It is immutable, so that the cached encoding of the transaction that spends it never gets stale.
+    It has no __dict__, to keep the memory footprint of the UTXO set low.
+    """
+
+    __slots__ = ('blknum', 'txindex', 'oindex')
+
     def __init__(self, blknum=0, txindex=0, oindex=0):
-        self.blknum = blknum
-        self.txindex = txindex
-        self.oindex = oindex
+        object.__setattr__(self, 'blknum', blknum)
+        object.__setattr__(self, 'txindex', txindex)
+        object.__setattr__(self, 'oindex', oindex)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("can't set attribute")
+
+    def __reduce__(self):
+        return TransactionInput, (self.blknum, self.txindex, self.oindex)
+
+    def __eq__(self, other):
+        if not isinstance(other, TransactionInput):
+            return NotImplemented
+        return (self.blknum, self.txindex, self.oindex) == (other.blknum, other.txindex, other.oindex)
+
+    def __hash__(self):
+        return hash((self.blknum, self.txindex, self.oindex))
 
     @property
     def utxo_id(self):
@@ -32,6 +57,12 @@ class TransactionInput:
         return encode_utxo_id(self.blknum, self.txindex, self.oindex)
 
 
+OUTPUT_SEDES = List([
+    big_endian_int,
+    List([Binary.fixed_length(20), Binary.fixed_length(20), big_endian_int])
+])
+
+
 class TransactionOutput(rlp.Serializable):
     fields = (
         ('output_type', rlp.sedes.big_endian_int),
@@ -39,6 +70,8 @@ class TransactionOutput(rlp.Serializable):
         ('token', rlp.sedes.Binary.fixed_length(20)),
         ('amount', big_endian_int)
     )
+    # fields live in slots, and owner and token addresses are interned, to keep the memory footprint of the UTXO set low
+    __slots__ = ('_output_type', '_output_guard', '_token', '_amount', '_cached_rlp', '_hash_cache')
 
     def __init__(self,
                  output_guard=NULL_ADDRESS,
@@ -46,18 +79,17 @@ class TransactionOutput(rlp.Serializable):
                  amount=0,
                  output_type=TxOutputTypes.PAYMENT.value):
 
-        output_guard = address.to_canonical_address(output_guard)
-        token = address.to_canonical_address(token)
-        amount = amount
+        output_guard = canonical_address(output_guard)
+        token = canonical_address(token)
+        self._cached_rlp = None
+        self._hash_cache = None
         super().__init__(output_type, output_guard, token, amount)
 
+    def __reduce__(self):
+        return TransactionOutput, (self.output_guard, self.token, self.amount, self.output_type)
+
     @classmethod
     def serialize(cls, obj):
-        sedes_list = List([
-            big_endian_int,
-            List([Binary.fixed_length(20), Binary.fixed_length(20), big_endian_int])
-        ])
-
         tx_elems = [
             obj.output_type,
             [
@@ -67,8 +99,7 @@ class TransactionOutput(rlp.Serializable):
             ]
         ]
 
-        tx_sedes = rlp.sedes.List(sedes_list)
-        return tx_sedes.serialize(tx_elems)
+        return OUTPUT_SEDES.serialize(tx_elems)
 
 
 class Transaction(rlp.Serializable):
@@ -113,10 +144,14 @@ class Transaction(rlp.Serializable):
         self.signatures = signatures[:]
         self._signers = signers[:]
         self.spent = [False] * len(outputs)
+        self._hash = None
 
     @property
     def hash(self):
-        return keccak(self.encoded)
+        # fields of the transaction (and its inputs) are immutable, so the hash can be computed once
+        if self._hash is None:
+            self._hash = keccak(self.encoded)
+        return self._hash
 
     @property
     def signers(self):
@@ -124,7 +159,14 @@ class Transaction(rlp.Serializable):
 
     @property
     def encoded(self):
-        return rlp.encode(self)
+        # the encoding is cached in _cached_rlp, the same place rlp.encode caches it
+        if self._cached_rlp is None:
+            try:
+                self._cached_rlp = encode_transaction(self, self.NUM_INPUTS, self.NUM_OUTPUTS)
+            except ValueError:
+                # does not fit the Payment schema, let rlp encode it or raise a serialization error
+                return rlp.encode(self)
+        return self._cached_rlp
 
     @property
     def is_deposit(self):
@@ -132,8 +174,6 @@ class Transaction(rlp.Serializable):
 
     @classmethod
     def serialize(cls, obj):
-        sedes_list = [field_sedes for field, field_sedes in cls._meta.fields]
-
         tx_elems = [
             obj.tx_type,
             [i.utxo_id for i in obj.inputs],
@@ -142,15 +182,17 @@ class Transaction(rlp.Serializable):
             obj.metadata
         ]
 
-        tx_sedes = rlp.sedes.List(sedes_list)
-        return tx_sedes.serialize(tx_elems)
+        return TRANSACTION_SEDES.serialize(tx_elems)
 
     def sign(self, index, account, verifying_contract=None):
         msg_hash = hash_struct(self, verifying_contract=verifying_contract)
-        sig = account.key.sign_msg_hash(msg_hash)
+        sig = ecdsa.sign(msg_hash, account.key)
         self.signatures[index] = amend_signature(sig.to_bytes())
-        self._signers[index] = sig.recover_public_key_from_msg_hash(
-            msg_hash).to_canonical_address() if sig != NULL_SIGNATURE else NULL_ADDRESS
+        # the signer follows from the key, recovering it from the signature would cost as much as signing
+        self._signers[index] = account.key.public_key.to_canonical_address()
+
+
+TRANSACTION_SEDES = List([field_sedes for _, field_sedes in Transaction._meta.fields])
 
 
 def amend_signature(sig):
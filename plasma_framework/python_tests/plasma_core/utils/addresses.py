@@ -0,0 +1,22 @@
+from eth_utils import address
+
+_canonical_addresses = {}
+
+
+def canonical_address(value):
+    """ Returns the 20-byte form of an address, interned.
+
+        Outputs of the same owner or token share one bytes object, and a hex address
+        is normalized once rather than on every output.
+    """
+    try:
+        canonical = _canonical_addresses.get(value)
+    except TypeError:  # unhashable, e.g. bytearray
+        value = bytes(value)
+        canonical = _canonical_addresses.get(value)
+
+    if canonical is None:
+        canonical = address.to_canonical_address(value)
+        canonical = _canonical_addresses.setdefault(canonical, canonical)
+        _canonical_addresses[value] = canonical
+    return canonical
@@ -0,0 +1,16 @@
+def select_backend(kind, backends, name=None):
+    """ Loads the given backend, or the first one available when no name is given.
+
+        backends is a sequence of (name, load) pairs, where load returns the implementation of the backend
+        or raises ImportError when its dependencies are not installed. Returns (name, implementation).
+    """
+    for backend_name, load in backends:
+        if name is not None and backend_name != name:
+            continue
+        try:
+            return backend_name, load()
+        except ImportError:
+            if name is not None:
+                raise
+
+    raise ValueError(f'unknown {kind} backend: {name}' if name else f'no {kind} backend available')
@@ -0,0 +1,92 @@
+import mmap
+import struct
+
+from plasma_core.block import Block
+from plasma_core.utils.payment_decoding import LazyBlock, decode_block, decode_transaction
+from plasma_core.utils.record_file import RecordFile
+from plasma_core.utils.transactions import decode_utxo_id
+
+# offset of a transaction in the encoded block
+TX_OFFSET = struct.Struct('>I')
+
+
+class BlockArchive(RecordFile):
+    """ Append-only file of blocks.
+
+        Each record holds a header with the block number and Merkle root, offsets of the transactions
+        in the encoded block, and the RLP encoded block. Reads go through mmap, so getting a transaction
+        decodes just its bytes, and opening the archive reads only the record headers.
+    """
+
+    MAGIC = b'PBLK'
+    # magic, block number, merkle root, number of transactions, length of the encoded block
+    RECORD_HEADER = struct.Struct('>4sQ32sII')
+    DESCRIPTION = 'block archive'
+
+    def __init__(self, path):
+        self._map = None
+        super().__init__(path)
+
+    def append(self, block):
+        super().append(block)
+        self._close_map()
+
+    def root(self, blknum):
+        return self._header(blknum)[2]
+
+    def get_block(self, blknum):
+        root, _, _, block_start, block_end = self._locate(blknum)
+        block = decode_block(self._mapped()[block_start:block_end])
+        return Block(block.transactions, number=block.number, root=root)
+
+    def get_transaction(self, utxo_pos):
+        (blknum, txindex, _) = decode_utxo_id(utxo_pos)
+        _, tx_count, offsets_start, block_start, _ = self._locate(blknum)
+        if txindex >= tx_count:
+            raise KeyError(utxo_pos)
+
+        store = self._mapped()
+        (start,) = TX_OFFSET.unpack_from(store, offsets_start + txindex * TX_OFFSET.size)
+        (end,) = TX_OFFSET.unpack_from(store, offsets_start + (txindex + 1) * TX_OFFSET.size)
+        return decode_transaction(store[block_start + start:block_start + end])
+
+    def close(self):
+        self._close_map()
+        super().close()
+
+    def _record(self, block):
+        encoded = block.encoded
+        offsets = LazyBlock(encoded).transaction_offsets()
+        record = bytearray(self.RECORD_HEADER.pack(self.MAGIC, block.number, block.root, len(block.transactions),
+                                                   len(encoded)))
+        for offset in offsets:
+            record += TX_OFFSET.pack(offset)
+        record += encoded
+        return record
+
+    def _body_length(self, header):
+        _, _, _, tx_count, block_length = header
+        return (tx_count + 1) * TX_OFFSET.size + block_length
+
+    def _header(self, blknum):
+        # the record is looked up first, as an empty archive file cannot be mapped
+        position = self._records[blknum]
+        return self.RECORD_HEADER.unpack_from(self._mapped(), position)
+
+    def _locate(self, blknum):
+        """ Returns (root, transaction count, offsets start, block start, block end) of the record of a block """
+        _, _, root, tx_count, block_length = self._header(blknum)
+        offsets_start = self._records[blknum] + self.RECORD_HEADER.size
+        block_start = offsets_start + (tx_count + 1) * TX_OFFSET.size
+        return root, tx_count, offsets_start, block_start, block_start + block_length
+
+    def _mapped(self):
+        # the map covers the file as it was when it got mapped, so it is remapped after appends
+        if self._map is None:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _close_map(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
@@ -0,0 +1,60 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from eth_keys import keys
+
+from plasma_core.block import Block, SignedBlock
+from plasma_core.utils import ecdsa
+from plasma_core.utils.keccak import keccak
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+
+# key of a pool worker, built once per process: creating a PrivateKey derives its public key, which costs about a signature
+_worker_key = None
+
+
+def sign_blocks(blocks, key, workers=None, max_in_flight=None):
+    """ Signs a stream of blocks, yields SignedBlocks in the order of the blocks.
+
+        Encoding, Merkle root, hash and signature of every block are computed in a process pool
+        of the given number of workers, or in the calling process when workers is not set.
+        At most max_in_flight blocks (twice the number of workers by default) are submitted
+        and not yet yielded, so the stream is consumed lazily.
+    """
+    if not workers:
+        for block in blocks:
+            yield _signed_block(block, *_sign(block, key))
+        return
+
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(key.to_bytes(),)) as executor:
+        for block in blocks:
+            in_flight.append((block, executor.submit(_sign_in_worker, block)))
+            if len(in_flight) >= max_in_flight:
+                block, future = in_flight.popleft()
+                yield _signed_block(block, *future.result())
+        while in_flight:
+            block, future = in_flight.popleft()
+            yield _signed_block(block, *future.result())
+
+
+def _init_worker(key_bytes):
+    global _worker_key
+    _worker_key = keys.PrivateKey(key_bytes)
+
+
+def _sign_in_worker(block):
+    return _sign(block, _worker_key)
+
+
+def _sign(block, key):
+    root = FixedMerkle(Block.MERKLE_DEPTH, [tx.encoded for tx in block.transactions]).root
+    block_hash = keccak(block.encoded)
+    signature = ecdsa.sign(block_hash, key)
+    return root, block_hash, signature.to_bytes()
+
+
+def _signed_block(block, root, block_hash, signature):
+    return SignedBlock(Block(block.transactions, block.number, root=root, block_hash=block_hash),
+                       keys.Signature(signature))
@@ -0,0 +1,112 @@
+import lzma
+import struct
+import zlib
+from collections import OrderedDict
+
+from plasma_core.block import Block
+from plasma_core.utils.payment_decoding import decode_block
+from plasma_core.utils.record_file import RecordFile
+from plasma_core.utils.transactions import decode_utxo_id
+
+ZLIB = 0
+LZMA = 1
+CODECS = {'zlib': ZLIB, 'lzma': LZMA}
+
+
+def compress(data, codec):
+    if codec == ZLIB:
+        return zlib.compress(data, 9)
+    if codec == LZMA:
+        return lzma.compress(data)
+    raise ValueError(f'unknown codec: {codec}')
+
+
+def decompress(data, codec):
+    if codec == ZLIB:
+        return zlib.decompress(data)
+    if codec == LZMA:
+        return lzma.decompress(data)
+    raise ValueError(f'unknown codec: {codec}')
+
+
+class ColdBlockStore(RecordFile):
+    """ Append-only file of compressed blocks, with an LRU of decompressed blocks in front of it.
+
+        Each record holds a header with the block number and Merkle root, and the compressed RLP
+        encoded block. Blocks are decompressed on access and the last cache_size of them are kept.
+    """
+
+    MAGIC = b'PBLZ'
+    # magic, block number, merkle root, codec, length of the compressed block
+    RECORD_HEADER = struct.Struct('>4sQ32sBI')
+    DESCRIPTION = 'cold block store'
+
+    def __init__(self, path, codec='zlib', cache_size=64):
+        if codec not in CODECS:
+            raise ValueError(f'unknown codec: {codec}')
+        self.codec = CODECS[codec]
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        super().__init__(path)
+
+    def root(self, blknum):
+        return self._read_header(self._records[blknum])[2]
+
+    def get_block(self, blknum):
+        block = self._cache.get(blknum)
+        if block is not None:
+            self._cache.move_to_end(blknum)
+            return block
+
+        position = self._records[blknum]
+        _, _, root, codec, length = self._read_header(position)
+        block = decode_block(decompress(self._read_at(position + self.RECORD_HEADER.size, length), codec))
+        block = Block(block.transactions, number=block.number, root=root)
+
+        self._cache[blknum] = block
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return block
+
+    def get_transaction(self, utxo_pos):
+        (blknum, txindex, _) = decode_utxo_id(utxo_pos)
+        return self.get_block(blknum).transactions[txindex]
+
+    def _record(self, block):
+        compressed = compress(block.encoded, self.codec)
+        return self.RECORD_HEADER.pack(self.MAGIC, block.number, block.root, self.codec, len(compressed)) + compressed
+
+    def _body_length(self, header):
+        return header[4]
+
+
+class TieredBlockStore(object):
+    """ Keeps the most recent hot_blocks blocks in memory and moves older ones to a ColdBlockStore.
+
+        Blocks read back from the cold tier are decoded anew, so any state kept on the block objects
+        (such as spent flags of transaction outputs) does not survive the move.
+    """
+
+    def __init__(self, cold_store, hot_blocks=1024):
+        self.cold_store = cold_store
+        self.hot_blocks = hot_blocks
+        self._hot = OrderedDict()
+
+    def add(self, block):
+        self._hot[block.number] = block
+        while len(self._hot) > self.hot_blocks:
+            _, oldest = self._hot.popitem(last=False)
+            self.cold_store.append(oldest)
+
+    def __contains__(self, blknum):
+        return blknum in self._hot or blknum in self.cold_store
+
+    def get_block(self, blknum):
+        block = self._hot.get(blknum)
+        if block is not None:
+            return block
+        return self.cold_store.get_block(blknum)
+
+    def get_transaction(self, utxo_pos):
+        (blknum, txindex, _) = decode_utxo_id(utxo_pos)
+        return self.get_block(blknum).transactions[txindex]
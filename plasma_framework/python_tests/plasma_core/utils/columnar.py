@@ -0,0 +1,84 @@
+from array import array
+from collections import defaultdict
+
+
+class ColumnarOutputs(object):
+    """ Struct-of-arrays view of the outputs of one or more blocks.
+
+        The i-th output is described by blknum[i], txindex[i], oindex[i], owner_ids[i], token_ids[i] and
+        amounts[i]. Owners and tokens are ids into the owners and tokens address tables. Positions are kept
+        in typed arrays; amounts are uint256, so they are kept as a list of ints.
+        Amounts are also kept grouped by owner and token pair as they are added, so that sums are reduced
+        by C-level sums over each group, with Python work per group rather than per output.
+    """
+
+    def __init__(self, blocks=()):
+        self.blknum = array('Q')
+        self.txindex = array('I')
+        self.oindex = array('B')
+        self.owner_ids = array('I')
+        self.token_ids = array('I')
+        self.amounts = []
+        self.owners = []
+        self.tokens = []
+        self._owner_ids = {}
+        self._token_ids = {}
+        self._groups = {}
+        for block in blocks:
+            self.add_block(block)
+
+    @classmethod
+    def from_block(cls, block):
+        return cls([block])
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def add_block(self, block):
+        for txindex, tx in enumerate(block.transactions):
+            for oindex, output in enumerate(tx.outputs):
+                owner_id = self._intern(self.owners, self._owner_ids, output.output_guard)
+                token_id = self._intern(self.tokens, self._token_ids, output.token)
+                group = self._groups.get((owner_id, token_id))
+                if group is None:
+                    group = self._groups[(owner_id, token_id)] = []
+                group.append(output.amount)
+                self.blknum.append(block.number)
+                self.txindex.append(txindex)
+                self.oindex.append(oindex)
+                self.owner_ids.append(owner_id)
+                self.token_ids.append(token_id)
+                self.amounts.append(output.amount)
+
+    def sum_by_owner(self, token=None):
+        """ Returns a dict of owner address to the total amount of their outputs, in the given token or in all tokens """
+        token_id = None
+        if token is not None:
+            if token not in self._token_ids:
+                return {}
+            token_id = self._token_ids[token]
+        sums = defaultdict(int)
+        for owner_id, _, amount in self._group_sums(token_id):
+            sums[self.owners[owner_id]] += amount
+        return dict(sums)
+
+    def sum_by_token(self):
+        """ Returns a dict of token address to the total amount of outputs in that token """
+        sums = defaultdict(int)
+        for _, token_id, amount in self._group_sums():
+            sums[self.tokens[token_id]] += amount
+        return dict(sums)
+
+    def _group_sums(self, token_id=None):
+        """ Yields (owner id, token id, total amount) of every owner and token pair, or of the pairs of the token """
+        for (owner_id, group_token_id), amounts in self._groups.items():
+            if token_id is None or group_token_id == token_id:
+                yield owner_id, group_token_id, sum(amounts)
+
+    @staticmethod
+    def _intern(table, ids, address):
+        id_ = ids.get(address)
+        if id_ is None:
+            id_ = ids[address] = len(table)
+            table.append(address)
+        return id_
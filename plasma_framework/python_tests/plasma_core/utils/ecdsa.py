@@ -0,0 +1,45 @@
+""" ECDSA signing and public key recovery with the fastest eth-keys backend available locally.
+
+    Backends are tried in order of preference: coincurve, then the pure Python backend of eth-keys.
+    A specific backend can be forced with use_backend().
+"""
+from eth_keys import KeyAPI
+from eth_keys.backends import CoinCurveECCBackend, NativeECCBackend
+
+from plasma_core.utils.backends import select_backend
+
+
+def _load_coincurve():
+    return KeyAPI(CoinCurveECCBackend())
+
+
+def _load_native():
+    return KeyAPI(NativeECCBackend())
+
+
+BACKENDS = (
+    ('coincurve', _load_coincurve),
+    ('native', _load_native),
+)
+
+backend = None
+_keys = None
+
+
+def use_backend(name=None):
+    """ Switches to the given backend, or to the first one available when no name is given """
+    global backend, _keys
+    backend, _keys = select_backend('ecdsa', BACKENDS, name)
+    return backend
+
+
+def sign(msg_hash, private_key):
+    """ Signs the hash with an eth_keys PrivateKey, returns an eth_keys Signature """
+    return _keys.ecdsa_sign(msg_hash, private_key)
+
+
+def recover_public_key(msg_hash, signature):
+    return _keys.ecdsa_recover(msg_hash, signature)
+
+
+use_backend()
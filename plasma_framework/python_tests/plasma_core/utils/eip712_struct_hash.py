@@ -1,7 +1,10 @@
-from eip712_structs import EIP712Struct, Address, Uint, Bytes, Array
+from functools import lru_cache
+
+from eth_abi import encode_single
+
 from plasma_core.constants import NULL_ADDRESS
+from plasma_core.utils.keccak import keccak
 from plasma_core.utils.utils import hex_to_binary
-from py_eth_sig_utils.eip712 import encode_typed_data
 
 domainSpec = [
     {'name': 'name', 'type': 'string'},
@@ -30,74 +33,110 @@ outputSpec = [
     {'name': 'amount', 'type': 'uint256'},
 ]
 
-data = {
-    'types': {
-        'EIP712Domain': domainSpec,
-        'Transaction': txSpec,
-        'Input': inputSpec,
-        'Output': outputSpec,
-    },
-    'domain': {
-        'name': 'OMG Network',
-        'version': '2',
-        'verifyingContract': '0x44de0ec539b8c4a4b530c78620fe8320167f2f74',
-        'salt': bytes.fromhex('fad5c7f626d80f9256ef01929f3beb96e058b8b4b0e3fe52d84f054c0e2a7a83'),
-    },
-    'primaryType': 'Transaction',
+types = {
+    'EIP712Domain': domainSpec,
+    'Transaction': txSpec,
+    'Input': inputSpec,
+    'Output': outputSpec,
 }
 
+domain = {
+    'name': 'OMG Network',
+    'version': '2',
+    'salt': bytes.fromhex('fad5c7f626d80f9256ef01929f3beb96e058b8b4b0e3fe52d84f054c0e2a7a83'),
+}
 
-def hash_struct(tx, verifying_contract=None):
-    verifying_address = hex_to_binary(verifying_contract) if verifying_contract else NULL_ADDRESS
-
-    data.get('domain')['verifyingContract'] = verifying_address
-    data['message'] = struct_tx_from_tx(tx)
-
-    typedData = encode_typed_data(data)
-    return typedData
-
-
-class Input(EIP712Struct):
-    blknum = Uint(256)
-    txindex = Uint(256)
-    oindex = Uint(256)
-
-
-class Output(EIP712Struct):
-    outputType = Uint(256)
-    outputGuard = Bytes(20)
-    currency = Address()
-    amount = Uint(256)
-
-
-class Transaction(EIP712Struct):
-    txType = Uint(256)
-    inputs = Array(Input)
-    outputs = Array(Output)
-    txData = Uint(256)
-    metadata = Bytes(32)
-
-
-def struct_tx_from_tx(tx):
-    inputs = _map_inputs(tx.inputs)
-    outputs = _map_outputs(tx.outputs)
-
-    return Transaction(
-        txType=tx.tx_type,
-        inputs=inputs,
-        outputs=outputs,
-        txData=tx.tx_data,
-        metadata=tx.metadata,
-    )
+EIP191_PREFIX = b'\x19\x01'
 
 
-def _map_inputs(inputs):
-    eip712_inputs = [Input(blknum=i.blknum, txindex=i.txindex, oindex=i.oindex) for i in inputs]
-    return eip712_inputs
+def hash_struct(tx, verifying_contract=None):
+    return keccak(EIP191_PREFIX + domain_separator(verifying_contract) + hash_transaction(tx))
 
 
-def _map_outputs(outputs):
-    eip712_outputs = []
-    for o in outputs:
-        eip712_outputs.append(Output(outputType=o.output_type, outputGuard=o.output_guard, currency=o.token, amount=o.amount))
-    return eip712_outputs
+@lru_cache(maxsize=None)
+def domain_separator(verifying_contract=None):
+    verifying_address = hex_to_binary(verifying_contract) if verifying_contract else NULL_ADDRESS
+    return _hash_struct('EIP712Domain', dict(domain, verifyingContract=verifying_address))
+
+
+def _encode_type(name):
+    """ The 'encodeType' of EIP-712: the struct, followed by the structs it references sorted by name """
+    dependencies = set()
+    _find_dependencies(name, dependencies)
+    dependencies.discard(name)
+    return ''.join(_struct_definition(struct_name) for struct_name in [name] + sorted(dependencies))
+
+
+def _find_dependencies(name, dependencies):
+    name = name.split('[')[0]
+    if name in dependencies or name not in types:
+        return
+    dependencies.add(name)
+    for member in types[name]:
+        _find_dependencies(member['type'], dependencies)
+
+
+def _struct_definition(name):
+    return name + '(' + ','.join(member['type'] + ' ' + member['name'] for member in types[name]) + ')'
+
+
+# type hashes do not depend on the data, so they are computed once
+TYPE_HASHES = {name: keccak(_encode_type(name).encode()) for name in types}
+
+
+WORD_SIZE = 32
+TX_TYPE_HASH = TYPE_HASHES['Transaction']
+INPUT_TYPE_HASH = TYPE_HASHES['Input']
+OUTPUT_TYPE_HASH = TYPE_HASHES['Output']
+
+
+def hash_transaction(tx):
+    """ The 'hashStruct' of a Payment transaction, the same as PaymentEip712Lib computes it.
+
+        ABI words of every struct are packed straight into one buffer, without building
+        the generic EIP-712 structs.
+    """
+    input_words = bytearray(INPUT_TYPE_HASH + bytes(3 * WORD_SIZE))
+    input_hashes = bytearray()
+    for tx_input in tx.inputs:
+        input_words[32:64] = tx_input.blknum.to_bytes(WORD_SIZE, 'big')
+        input_words[64:96] = tx_input.txindex.to_bytes(WORD_SIZE, 'big')
+        input_words[96:128] = tx_input.oindex.to_bytes(WORD_SIZE, 'big')
+        input_hashes += keccak(input_words)
+
+    output_words = bytearray(OUTPUT_TYPE_HASH + bytes(4 * WORD_SIZE))
+    output_hashes = bytearray()
+    for output in tx.outputs:
+        output_words[32:64] = output.output_type.to_bytes(WORD_SIZE, 'big')
+        # outputGuard is bytes20, aligned left, while currency is an address, aligned right
+        output_words[64:84] = output.output_guard
+        output_words[108:128] = output.token
+        output_words[128:160] = output.amount.to_bytes(WORD_SIZE, 'big')
+        output_hashes += keccak(output_words)
+
+    return keccak(b''.join([
+        TX_TYPE_HASH,
+        tx.tx_type.to_bytes(WORD_SIZE, 'big'),
+        keccak(input_hashes),
+        keccak(output_hashes),
+        tx.tx_data.to_bytes(WORD_SIZE, 'big'),
+        tx.metadata.ljust(WORD_SIZE, b'\x00'),
+    ]))
+
+
+def _hash_struct(name, values):
+    encoded = [TYPE_HASHES[name]]
+    for member in types[name]:
+        encoded.append(_encode_value(member['type'], values[member['name']]))
+    return keccak(b''.join(encoded))
+
+
+def _encode_value(value_type, value):
+    if value_type == 'string':
+        return keccak(value.encode())
+    if value_type in types:
+        return _hash_struct(value_type, value)
+    if value_type.endswith('[]'):
+        item_type = value_type[:-2]
+        return keccak(b''.join(_encode_value(item_type, item) for item in value))
+    return encode_single(value_type, value)
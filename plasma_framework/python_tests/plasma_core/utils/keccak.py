@@ -0,0 +1,60 @@
+""" Keccak-256 hashing with the fastest backend available locally.
+
+    Backends are tried in order of preference: pysha3, pycryptodome and finally eth-hash,
+    which eth-utils uses under the hood. A specific backend can be forced with use_backend().
+"""
+from plasma_core.utils.backends import select_backend
+
+
+def _load_pysha3():
+    import sha3
+
+    def keccak(data):
+        return sha3.keccak_256(data).digest()
+    return keccak
+
+
+def _load_pycryptodome():
+    from Crypto.Hash import keccak as pycryptodome_keccak
+
+    def keccak(data):
+        return pycryptodome_keccak.new(data=data, digest_bits=256).digest()
+    return keccak
+
+
+def _load_eth_hash():
+    from eth_hash.auto import keccak
+
+    def keccak_bytes(data):
+        return keccak(bytes(data))
+    return keccak_bytes
+
+
+BACKENDS = (
+    ('pysha3', _load_pysha3),
+    ('pycryptodome', _load_pycryptodome),
+    ('eth-hash', _load_eth_hash),
+)
+
+backend = None
+_keccak = None
+
+
+def use_backend(name=None):
+    """ Switches to the given backend, or to the first one available when no name is given """
+    global backend, _keccak
+    backend, _keccak = select_backend('keccak', BACKENDS, name)
+    return backend
+
+
+def keccak(data):
+    return _keccak(data)
+
+
+def keccak_many(items):
+    """ Hashes every item of the list, paying the backend lookup once per batch """
+    hash_one = _keccak
+    return [hash_one(item) for item in items]
+
+
+use_backend()
@@ -1,20 +1,80 @@
-from eth_utils import keccak as sha3
+from array import array
+from functools import lru_cache
+
+from plasma_core.utils.keccak import keccak as sha3, keccak_many
 from .exceptions import MemberNotExistException
 from plasma_core.constants import NULL_HASH
 
 LEAF_SALT = b'\x00'
 NODE_SALT = b'\x01'
+NODE_SIZE = 32
+
+
+@lru_cache(maxsize=None)
+def get_zero_hashes(depth):
+    """ Pre-computes hashes of empty subtrees, the same way Vault.getZeroHashes() does.
+
+        The i-th element is the root of an empty subtree of height i, so the 0-th element is the empty leaf
+        and the depth-th element is the root of an empty tree.
+    """
+    hashes = []
+    zero_hash = sha3(LEAF_SALT + NULL_HASH)
+    for _ in range(depth + 1):
+        hashes.append(zero_hash)
+        zero_hash = sha3(NODE_SALT + zero_hash + zero_hash)
+    return tuple(hashes)
+
+
+def check_membership(leaf, index, root, proof, depth):
+    """ Checks a proof against a root, without the tree. Proof segments are read through a memoryview, not copied """
+    proof = memoryview(proof)
+    computed_hash = sha3(LEAF_SALT + leaf)
+    computed_index = index
+
+    for i in range(0, depth * NODE_SIZE, NODE_SIZE):
+        proof_segment = proof[i:i + NODE_SIZE]
+
+        if computed_index % 2 == 0:
+            computed_hash = sha3(NODE_SALT + computed_hash + proof_segment)
+        else:
+            computed_hash = sha3(NODE_SALT + proof_segment + computed_hash)
+        computed_index = computed_index // 2
+
+    return computed_hash == root
+
+
+class MembershipProofs(object):
+    """ Proofs of several leaves of one tree, kept in a single contiguous buffer.
 
+        The proof of the leaf at indices[i] starts at offsets[i] of the buffer. Indexing returns
+        a memoryview of the proof, so iterating over the batch does not allocate a copy per proof.
+    """
 
-class MerkleNode(object):
+    def __init__(self, indices, proof_size):
+        self.indices = array('Q', indices)
+        self.proof_size = proof_size
+        self.offsets = array('Q', range(0, len(self.indices) * proof_size, proof_size))
+        self.buffer = bytearray(len(self.indices) * proof_size)
 
-    def __init__(self, data, left=None, right=None):
-        self.data = data
-        self.left = left
-        self.right = right
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, position):
+        offset = self.offsets[position]
+        return memoryview(self.buffer)[offset:offset + self.proof_size]
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
 
 
 class FixedMerkle(object):
+    """ Merkle tree of a fixed depth, padded with empty leaves.
+
+        Every level is kept in one contiguous bytearray of 32-byte slots. Only the nodes that have
+        at least one non-empty leaf below are stored, every other node is taken from the table
+        of empty subtree hashes.
+    """
 
     def __init__(self, depth, leaves=[]):
         if depth < 1:
@@ -26,65 +86,88 @@ class FixedMerkle(object):
         if len(leaves) > self.leaf_count:
             raise ValueError('number of leaves should be at most depth ** 2')
 
-        leaves = [sha3(LEAF_SALT + leaf) for leaf in leaves]
+        self.zero_hashes = get_zero_hashes(depth)
+        self.__leaf_index = None
+        self.tree = [bytearray(b''.join(keccak_many([LEAF_SALT + leaf for leaf in leaves])))]
+        self.__create_tree()
 
-        self.leaves = leaves + [sha3(LEAF_SALT + NULL_HASH)] * (self.leaf_count - len(leaves))
-        self.tree = [self.__create_nodes(self.leaves)]
-        self.__create_tree(self.tree[0])
+    @property
+    def leaves(self):
+        hashed_leaves = [bytes(self.get_node(0, index)) for index in range(self.__level_size(0))]
+        return hashed_leaves + [self.zero_hashes[0]] * (self.leaf_count - len(hashed_leaves))
 
-    def __create_nodes(self, leaves):
-        return [MerkleNode(leaf) for leaf in leaves]
+    def __create_tree(self):
+        for level in range(self.depth):
+            nodes = memoryview(self.tree[level])
+            pairs = [NODE_SALT + nodes[offset:offset + 2 * NODE_SIZE] for offset in range(0, len(nodes), 2 * NODE_SIZE)]
+            if len(nodes) % (2 * NODE_SIZE):
+                # the last node has no non-empty right sibling
+                pairs[-1] += self.zero_hashes[level]
 
-    def __create_tree(self, leaves):
-        if len(leaves) == 1:
-            self.root = leaves[0].data
-            return
+            self.tree.append(bytearray(b''.join(keccak_many(pairs))))
 
-        next_level = len(leaves)
-        tree_level = []
+        self.root = bytes(self.get_node(self.depth, 0))
 
-        for i in range(0, next_level, 2):
-            combined = sha3(NODE_SALT + leaves[i].data + leaves[i + 1].data)
-            next_node = MerkleNode(combined, leaves[i], leaves[i + 1])
-            tree_level.append(next_node)
+    def __level_size(self, level):
+        return len(self.tree[level]) // NODE_SIZE
 
-        self.tree.append(tree_level)
-        self.__create_tree(tree_level)
+    def get_node(self, level, index):
+        if index < self.__level_size(level):
+            return memoryview(self.tree[level])[index * NODE_SIZE:(index + 1) * NODE_SIZE]
+        return self.zero_hashes[level]
 
     def check_membership(self, leaf, index, proof):
-        hashed_leaf = sha3(LEAF_SALT + leaf)
-        computed_hash = hashed_leaf
-        computed_index = index
-
-        for i in range(0, self.depth * 32, 32):
-            proof_segment = proof[i:i + 32]
-
-            if computed_index % 2 == 0:
-                computed_hash = sha3(NODE_SALT + computed_hash + proof_segment)
-            else:
-                computed_hash = sha3(NODE_SALT + proof_segment + computed_hash)
-            computed_index = computed_index // 2
-
-        return computed_hash == self.root
+        return check_membership(leaf, index, self.root, proof, self.depth)
 
     def create_membership_proof(self, leaf):
         hashed_leaf = sha3(LEAF_SALT + leaf)
-        if not self.__is_member(hashed_leaf):
+        index = self.__index_of(hashed_leaf)
+        if index is None:
             raise MemberNotExistException('leaf is not in the merkle tree')
 
-        index = self.leaves.index(hashed_leaf)
-        proof = b''
-
-        for i in range(0, self.depth, 1):
-            if index % 2 == 0:
-                sibling_index = index + 1
-            else:
-                sibling_index = index - 1
-            index = index // 2
-
-            proof += self.tree[i][sibling_index].data
-
-        return proof
-
-    def __is_member(self, leaf):
-        return leaf in self.leaves
+        return self.create_membership_proof_at(index)
+
+    def create_membership_proof_at(self, index):
+        """ Creates a proof for the leaf at the given position, without hashing or looking up the leaf """
+        return bytes(self.create_membership_proofs([index])[0])
+
+    def create_membership_proofs(self, indices=None):
+        """ Creates proofs for the leaves at the given positions in one pass over the levels.
+
+            When no positions are given, proofs for all non-empty leaves are created.
+        """
+        if indices is None:
+            indices = range(self.__level_size(0))
+        else:
+            # indices may be a one-shot iterable, while they are read twice
+            indices = list(indices)
+        if any(not 0 <= index < self.leaf_count for index in indices):
+            raise ValueError('index should be lower than number of leaves')
+
+        proofs = MembershipProofs(indices, self.depth * NODE_SIZE)
+
+        for level in range(self.depth):
+            level_offset = level * NODE_SIZE
+            for position, index in enumerate(proofs.indices):
+                offset = proofs.offsets[position] + level_offset
+                sibling_index = (index >> level) ^ 1
+                proofs.buffer[offset:offset + NODE_SIZE] = self.get_node(level, sibling_index)
+
+        return proofs
+
+    def __index_of(self, leaf):
+        """ Returns the position of the first occurrence of the hashed leaf, or None if it is not in the tree """
+        if self.__leaf_index is None:
+            self.__leaf_index = self.__create_leaf_index()
+
+        index = self.__leaf_index.get(leaf)
+        if index is None and leaf == self.zero_hashes[0] and self.__level_size(0) < self.leaf_count:
+            # the first empty leaf
+            return self.__level_size(0)
+        return index
+
+    def __create_leaf_index(self):
+        hashed_leaves = memoryview(self.tree[0])
+        # iterate backwards so that duplicated leaves are indexed at their first occurrence
+        return {bytes(hashed_leaves[index * NODE_SIZE:(index + 1) * NODE_SIZE]): index
+                for index in reversed(range(self.__level_size(0)))}
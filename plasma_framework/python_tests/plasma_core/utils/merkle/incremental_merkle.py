@@ -0,0 +1,62 @@
+from plasma_core.utils.keccak import keccak as sha3
+from .fixed_merkle import LEAF_SALT, NODE_SALT, get_zero_hashes
+
+
+class IncrementalMerkle(object):
+    """ Append-only Merkle tree of a fixed depth, with the same root as FixedMerkle built from the same leaves.
+
+        Only the frontier (the left siblings still waiting for their right neighbour) is kept,
+        so appending a leaf and getting the current root both cost O(depth) hashes.
+    """
+
+    def __init__(self, depth, leaves=[]):
+        if depth < 1:
+            raise ValueError('depth must be at least 1')
+
+        self.depth = depth
+        self.leaf_count = 2 ** depth
+        self.zero_hashes = get_zero_hashes(depth)
+        self.frontier = [None] * depth
+        self.size = 0
+        self.__root = self.zero_hashes[depth]
+
+        for leaf in leaves:
+            self.append(leaf)
+
+    def append(self, leaf):
+        if self.size == self.leaf_count:
+            raise ValueError('number of leaves should be at most depth ** 2')
+
+        node = sha3(LEAF_SALT + leaf)
+        index = self.size
+        self.size += 1
+        self.__root = None
+
+        for level in range(self.depth):
+            if index % 2 == 0:
+                self.frontier[level] = node
+                return
+            node = sha3(NODE_SALT + self.frontier[level] + node)
+            index = index // 2
+
+        # the last leaf completes the tree
+        self.__root = node
+
+    @property
+    def root(self):
+        if self.__root is None:
+            self.__root = self.__compute_root()
+        return self.__root
+
+    def __compute_root(self):
+        node = self.zero_hashes[0]
+        index = self.size
+
+        for level in range(self.depth):
+            if index % 2 == 1:
+                node = sha3(NODE_SALT + self.frontier[level] + node)
+            else:
+                node = sha3(NODE_SALT + node + self.zero_hashes[level])
+            index = index // 2
+
+        return node
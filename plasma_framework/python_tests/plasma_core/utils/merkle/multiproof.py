@@ -0,0 +1,84 @@
+import struct
+
+from plasma_core.utils.keccak import keccak as sha3
+from .fixed_merkle import LEAF_SALT, NODE_SALT, NODE_SIZE
+
+# number of proven leaves, followed by their indices
+COUNT = struct.Struct('>I')
+INDEX = struct.Struct('>I')
+
+
+class Multiproof(object):
+    """ Proof of several leaves of one tree, where every sibling node is sent at most once.
+
+        Siblings that can be computed from the proven leaves are omitted. The remaining nodes are
+        ordered level by level, and within a level by the index of the node they are a sibling of.
+    """
+
+    def __init__(self, indices, nodes):
+        self.indices = tuple(indices)
+        self.nodes = bytes(nodes)
+
+    def encode(self):
+        return COUNT.pack(len(self.indices)) + b''.join(INDEX.pack(index) for index in self.indices) + self.nodes
+
+    @classmethod
+    def decode(cls, data):
+        (count,) = COUNT.unpack_from(data)
+        indices = [INDEX.unpack_from(data, COUNT.size + i * INDEX.size)[0] for i in range(count)]
+        nodes = data[COUNT.size + count * INDEX.size:]
+        if len(nodes) % NODE_SIZE != 0:
+            raise ValueError('length of multiproof nodes must be a multiple of 32')
+        return cls(indices, nodes)
+
+
+def create_multiproof(merkle, indices):
+    """ Creates a multiproof of the leaves of a FixedMerkle at the given indices """
+    indices = sorted(set(indices))
+    if any(not 0 <= index < merkle.leaf_count for index in indices):
+        raise ValueError('index should be lower than number of leaves')
+
+    nodes = bytearray()
+    known = indices
+    for level in range(merkle.depth):
+        known_set = set(known)
+        for index in known:
+            sibling_index = index ^ 1
+            if sibling_index not in known_set:
+                nodes += merkle.get_node(level, sibling_index)
+        known = sorted({index // 2 for index in known})
+
+    return Multiproof(indices, nodes)
+
+
+def check_multiproof(leaves, root, multiproof, depth):
+    """ Checks a multiproof against a root. Leaves are given in the order of multiproof.indices """
+    if not leaves or len(leaves) != len(multiproof.indices):
+        return False
+
+    nodes = memoryview(multiproof.nodes)
+    node_offset = 0
+    hashes = dict(zip(multiproof.indices, (sha3(LEAF_SALT + leaf) for leaf in leaves)))
+    if len(hashes) != len(leaves) or any(index >= 2 ** depth for index in hashes):
+        return False
+
+    for _ in range(depth):
+        parents = {}
+        for index in sorted(hashes):
+            if index // 2 in parents:
+                continue
+
+            sibling_hash = hashes.get(index ^ 1)
+            if sibling_hash is None:
+                if node_offset + NODE_SIZE > len(nodes):
+                    return False
+                sibling_hash = nodes[node_offset:node_offset + NODE_SIZE]
+                node_offset += NODE_SIZE
+
+            if index % 2 == 0:
+                parents[index // 2] = sha3(NODE_SALT + hashes[index] + sibling_hash)
+            else:
+                parents[index // 2] = sha3(NODE_SALT + sibling_hash + hashes[index])
+        hashes = parents
+
+    return node_offset == len(nodes) and hashes[0] == root
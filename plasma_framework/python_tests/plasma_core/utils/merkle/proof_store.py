@@ -0,0 +1,128 @@
+import mmap
+import os
+import struct
+from collections import OrderedDict
+
+from .fixed_merkle import NODE_SIZE, get_zero_hashes
+
+MAGIC = b'PMKL'
+# magic, depth
+HEADER = struct.Struct('>4sB')
+# number of stored nodes of a level
+LEVEL_SIZE = struct.Struct('>I')
+
+
+class StoredMerkle(object):
+    """ Merkle levels of one block, read from a memory-mapped store file """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.store = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.depth = HEADER.unpack_from(self.store)
+        if magic != MAGIC:
+            self.store.close()
+            raise ValueError(f'{path} is not a merkle proof store file')
+
+        self.zero_hashes = get_zero_hashes(self.depth)
+        self.level_sizes = [LEVEL_SIZE.unpack_from(self.store, HEADER.size + level * LEVEL_SIZE.size)[0]
+                            for level in range(self.depth + 1)]
+        self.level_offsets = []
+        offset = HEADER.size + (self.depth + 1) * LEVEL_SIZE.size
+        for size in self.level_sizes:
+            self.level_offsets.append(offset)
+            offset += size * NODE_SIZE
+
+    @property
+    def root(self):
+        return self.get_node(self.depth, 0)
+
+    def get_node(self, level, index):
+        if index < self.level_sizes[level]:
+            offset = self.level_offsets[level] + index * NODE_SIZE
+            return self.store[offset:offset + NODE_SIZE]
+        return self.zero_hashes[level]
+
+    def create_membership_proof_at(self, index):
+        if not 0 <= index < 2 ** self.depth:
+            raise ValueError('index should be lower than number of leaves')
+
+        proof = bytearray(self.depth * NODE_SIZE)
+        for level in range(self.depth):
+            sibling_index = (index >> level) ^ 1
+            proof[level * NODE_SIZE:(level + 1) * NODE_SIZE] = self.get_node(level, sibling_index)
+        return bytes(proof)
+
+    def close(self):
+        self.store.close()
+
+
+class MerkleProofStore(object):
+    """ On-disk store of the Merkle levels of historical blocks, one file per block.
+
+        A file holds the non-empty part of every level of a FixedMerkle, in 32-byte slots.
+        Files are opened with mmap, so creating a proof reads depth slots from the page cache
+        without rebuilding the tree or loading it into memory. At most max_open_files stay mapped.
+    """
+
+    def __init__(self, directory, max_open_files=256):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_open_files = max_open_files
+        self._open_trees = OrderedDict()
+
+    def write(self, blknum, merkle):
+        header = HEADER.pack(MAGIC, merkle.depth)
+        header += b''.join(LEVEL_SIZE.pack(len(level) // NODE_SIZE) for level in merkle.tree)
+
+        path = self._path(blknum)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            for level in merkle.tree:
+                f.write(level)
+        self._close_tree(blknum)
+        os.replace(tmp_path, path)
+
+    def __contains__(self, blknum):
+        return os.path.exists(self._path(blknum))
+
+    def root(self, blknum):
+        return self._open(blknum).root
+
+    def create_membership_proof_at(self, blknum, index):
+        return self._open(blknum).create_membership_proof_at(index)
+
+    def close(self):
+        for blknum in list(self._open_trees):
+            self._close_tree(blknum)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _path(self, blknum):
+        return os.path.join(self.directory, f'{blknum}.merkle')
+
+    def _open(self, blknum):
+        tree = self._open_trees.get(blknum)
+        if tree is not None:
+            self._open_trees.move_to_end(blknum)
+            return tree
+
+        try:
+            tree = StoredMerkle(self._path(blknum))
+        except FileNotFoundError:
+            raise KeyError(blknum)
+
+        self._open_trees[blknum] = tree
+        if len(self._open_trees) > self.max_open_files:
+            self._close_tree(next(iter(self._open_trees)))
+        return tree
+
+    def _close_tree(self, blknum):
+        tree = self._open_trees.pop(blknum, None)
+        if tree is not None:
+            tree.close()
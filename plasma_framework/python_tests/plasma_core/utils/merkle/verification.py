@@ -0,0 +1,57 @@
+from plasma_core.utils.transactions import decode_utxo_id
+from .fixed_merkle import NODE_SIZE, check_membership
+
+# batches smaller than this are verified in the calling process, as spawning workers would cost more
+PARALLEL_THRESHOLD = 1024
+CHUNK_SIZE = 512
+
+
+def verify_proofs(root_by_block, proofs, executor=None):
+    """ Verifies inclusion proofs of transactions against the roots of their blocks.
+
+        Each proof is a (leaf, position, proof) tuple, where position is the utxo position of the leaf
+        (or its transaction position), as passed to startStandardExit/startInFlightExit. The proof is checked
+        the same way Merkle.checkMembership does it. A block missing from root_by_block fails the proof.
+
+        Returns a bitmap where bit i (bit i % 8 of byte i // 8) is set when i-th proof is valid.
+        With an executor (a long-lived process pool owned by the caller), batches of at least
+        PARALLEL_THRESHOLD proofs are split into chunks over its workers.
+    """
+    proofs = list(proofs)
+    if executor is None or len(proofs) < PARALLEL_THRESHOLD:
+        return _verify_chunk(root_by_block, proofs)
+
+    # chunk size is a multiple of 8 so that chunk bitmaps can be concatenated
+    chunks = [proofs[i:i + CHUNK_SIZE] for i in range(0, len(proofs), CHUNK_SIZE)]
+    bitmaps = executor.map(_verify_chunk, [_roots_of_chunk(root_by_block, chunk) for chunk in chunks], chunks)
+    return bytearray(b''.join(bitmaps))
+
+
+def is_valid(bitmap, position):
+    return bool(bitmap[position // 8] >> (position % 8) & 1)
+
+
+def _roots_of_chunk(root_by_block, chunk):
+    blknums = {decode_utxo_id(position)[0] for _, position, _ in chunk}
+    return {blknum: root_by_block[blknum] for blknum in blknums if blknum in root_by_block}
+
+
+def _verify_chunk(root_by_block, proofs):
+    bitmap = bytearray((len(proofs) + 7) // 8)
+    for i, (leaf, position, proof) in enumerate(proofs):
+        if _verify_proof(root_by_block, leaf, position, proof):
+            bitmap[i // 8] |= 1 << (i % 8)
+    return bitmap
+
+
+def _verify_proof(root_by_block, leaf, position, proof):
+    (blknum, txindex, _) = decode_utxo_id(position)
+    root = root_by_block.get(blknum)
+    if root is None:
+        return False
+
+    depth = len(proof) // NODE_SIZE
+    if len(proof) == 0 or len(proof) % NODE_SIZE != 0 or txindex >= 2 ** depth:
+        return False
+
+    return check_membership(leaf, txindex, root, proof, depth)
@@ -0,0 +1,228 @@
+""" Lazy decoder of RLP encoded Payment transactions and blocks.
+
+    Decoding works over a memoryview of the encoded bytes. Offsets of the fields are parsed once,
+    and inputs, outputs and amounts are materialized only when they are accessed.
+"""
+from rlp.exceptions import DecodingError
+
+from plasma_core.transaction import Transaction, TransactionInput, TransactionOutput, TxTypes
+from plasma_core.block import Block
+from plasma_core.utils.transactions import decode_utxo_id
+
+SHORT_LENGTH_LIMIT = 55
+STRING_OFFSET = 0x80
+LONG_STRING_OFFSET = 0xb7
+LIST_OFFSET = 0xc0
+LONG_LIST_OFFSET = 0xf7
+
+UTXO_ID_LENGTH = 32
+ADDRESS_LENGTH = 20
+METADATA_LENGTH = 32
+TX_TYPE_VALUES = {tx_type.value for tx_type in TxTypes}
+
+
+def decode_transaction(data):
+    return LazyTransaction(data).to_transaction()
+
+
+def decode_block(data):
+    return LazyBlock(data).to_block()
+
+
+class LazyTransaction(object):
+
+    def __init__(self, data):
+        self.view = memoryview(data)
+        fields = _decode_list(self.view, 0, len(self.view))
+        if len(fields) != 5:
+            raise DecodingError('transaction must have 5 fields', data)
+        self._fields = fields
+        self._inputs = _list_items(self.view, fields[1])
+        self._outputs = _list_items(self.view, fields[2])
+        if len(self._inputs) > Transaction.NUM_INPUTS or len(self._outputs) > Transaction.NUM_OUTPUTS:
+            raise DecodingError('too many inputs or outputs', bytes(self.view))
+        self._decoded_inputs = {}
+        self._decoded_outputs = {}
+
+    @property
+    def encoded(self):
+        return bytes(self.view)
+
+    @property
+    def tx_type(self):
+        tx_type = _decode_int(self.view, self._fields[0])
+        if tx_type not in TX_TYPE_VALUES:
+            raise DecodingError('unknown transaction type', bytes(self.view))
+        return tx_type
+
+    @property
+    def tx_data(self):
+        return _decode_int(self.view, self._fields[3])
+
+    @property
+    def metadata(self):
+        metadata = _string_payload(self.view, self._fields[4])
+        if len(metadata) != METADATA_LENGTH:
+            raise DecodingError('metadata must be 32 bytes long', bytes(self.view))
+        return bytes(metadata)
+
+    @property
+    def input_count(self):
+        return len(self._inputs)
+
+    @property
+    def output_count(self):
+        return len(self._outputs)
+
+    def get_input(self, index):
+        tx_input = self._decoded_inputs.get(index)
+        if tx_input is None:
+            utxo_id = _string_payload(self.view, self._inputs[index])
+            if len(utxo_id) != UTXO_ID_LENGTH:
+                raise DecodingError('utxo position must be 32 bytes long', bytes(self.view))
+            utxo_id = int.from_bytes(utxo_id, 'big')
+            tx_input = TransactionInput(*decode_utxo_id(utxo_id))
+            self._decoded_inputs[index] = tx_input
+        return tx_input
+
+    def get_output(self, index):
+        output = self._decoded_outputs.get(index)
+        if output is None:
+            output_type, output_guard, token, amount = self._output_fields(index)
+            output_guard = _string_payload(self.view, output_guard)
+            token = _string_payload(self.view, token)
+            if len(output_guard) != ADDRESS_LENGTH or len(token) != ADDRESS_LENGTH:
+                raise DecodingError('output guard and token must be 20 bytes long', bytes(self.view))
+            output = TransactionOutput(bytes(output_guard),
+                                       bytes(token),
+                                       _decode_int(self.view, amount),
+                                       _decode_int(self.view, output_type))
+            self._decoded_outputs[index] = output
+        return output
+
+    def get_amount(self, index):
+        """ Decodes the amount of an output, without materializing the output """
+        return _decode_int(self.view, self._output_fields(index)[3])
+
+    @property
+    def inputs(self):
+        return [self.get_input(index) for index in range(self.input_count)]
+
+    @property
+    def outputs(self):
+        return [self.get_output(index) for index in range(self.output_count)]
+
+    def to_transaction(self):
+        return Transaction(tx_type=TxTypes(self.tx_type),
+                           inputs=[(i.blknum, i.txindex, i.oindex) for i in self.inputs],
+                           outputs=[(o.output_guard, o.token, o.amount, o.output_type) for o in self.outputs],
+                           tx_data=self.tx_data,
+                           metadata=self.metadata)
+
+    def _output_fields(self, index):
+        output = _list_items(self.view, self._outputs[index])
+        if len(output) != 2:
+            raise DecodingError('output must have 2 fields', bytes(self.view))
+        fields = _list_items(self.view, output[1])
+        if len(fields) != 3:
+            raise DecodingError('output data must have 3 fields', bytes(self.view))
+        return (output[0],) + tuple(fields)
+
+
+class LazyBlock(object):
+
+    def __init__(self, data):
+        self.view = memoryview(data)
+        fields = _decode_list(self.view, 0, len(self.view))
+        if len(fields) != 2:
+            raise DecodingError('block must have 2 fields', data)
+        self._transactions = _list_items(self.view, fields[0])
+        self._number = fields[1]
+
+    @property
+    def number(self):
+        return _decode_int(self.view, self._number)
+
+    def __len__(self):
+        return len(self._transactions)
+
+    def get_transaction(self, index):
+        (start, payload_start, end) = self._transactions[index]
+        return LazyTransaction(self.view[start:end])
+
+    def transaction_offsets(self):
+        """ Returns offsets of the encoded transactions in the block, and the offset where the last one ends """
+        return [start for start, _, _ in self._transactions] + [self._transactions[-1][2] if self._transactions else 0]
+
+    def to_block(self):
+        transactions = [self.get_transaction(index).to_transaction() for index in range(len(self))]
+        return Block(transactions, number=self.number)
+
+
+def _decode_header(view, offset, end):
+    """ Returns (payload offset, item end) of the item at the offset """
+    if offset >= end:
+        raise DecodingError('unexpected end of data', bytes(view))
+
+    prefix = view[offset]
+    if prefix < STRING_OFFSET:
+        return offset, offset + 1
+    if prefix <= LONG_STRING_OFFSET:
+        item_end = _checked_end(view, offset + 1 + prefix - STRING_OFFSET, end)
+        if prefix == STRING_OFFSET + 1 and view[offset + 1] < STRING_OFFSET:
+            raise DecodingError('single byte below 0x80 encoded as a short string', bytes(view))
+        return offset + 1, item_end
+    if prefix < LIST_OFFSET:
+        return _long_payload(view, offset, end, prefix - LONG_STRING_OFFSET)
+    if prefix <= LONG_LIST_OFFSET:
+        return offset + 1, _checked_end(view, offset + 1 + prefix - LIST_OFFSET, end)
+    return _long_payload(view, offset, end, prefix - LONG_LIST_OFFSET)
+
+
+def _long_payload(view, offset, end, length_size):
+    payload_start = offset + 1 + length_size
+    length = int.from_bytes(view[offset + 1:_checked_end(view, payload_start, end)], 'big')
+    if length <= SHORT_LENGTH_LIMIT:
+        raise DecodingError('long length prefix used for a short item', bytes(view))
+    return payload_start, _checked_end(view, payload_start + length, end)
+
+
+def _checked_end(view, item_end, end):
+    if item_end > end:
+        raise DecodingError('item exceeds its enclosing data', bytes(view))
+    return item_end
+
+
+def _decode_list(view, offset, end):
+    payload_start, item_end = _decode_header(view, offset, end)
+    if item_end != end:
+        raise DecodingError('trailing bytes after a list', bytes(view))
+    return _list_items(view, (offset, payload_start, item_end))
+
+
+def _list_items(view, item):
+    """ Returns (start, payload start, end) offsets of the elements of the list item """
+    (start, offset, end) = item
+    if view[start] < LIST_OFFSET:
+        raise DecodingError('expected a list', bytes(view))
+
+    items = []
+    while offset < end:
+        payload_start, item_end = _decode_header(view, offset, end)
+        items.append((offset, payload_start, item_end))
+        offset = item_end
+    return items
+
+
+def _string_payload(view, item):
+    (start, payload_start, end) = item
+    if view[start] >= LIST_OFFSET:
+        raise DecodingError('expected a string', bytes(view))
+    return view[payload_start:end]
+
+
+def _decode_int(view, item):
+    payload = _string_payload(view, item)
+    if len(payload) > 0 and payload[0] == 0:
+        raise DecodingError('integer has leading zeros', bytes(view))
+    return int.from_bytes(payload, 'big')
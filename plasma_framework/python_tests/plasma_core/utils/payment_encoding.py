@@ -0,0 +1,157 @@
+""" Fast RLP encoder for the fixed schema of Payment transactions.
+
+    The encoding is byte-identical to rlp.encode(tx) of plasma_core.transaction.Transaction,
+    but lengths and payloads are written straight into one preallocated bytearray,
+    without building sedes objects or intermediate lists.
+"""
+from plasma_core.constants import EMPTY_METADATA
+from plasma_core.utils.addresses import canonical_address
+from plasma_core.utils.keccak import keccak
+
+SHORT_LENGTH_LIMIT = 55
+STRING_OFFSET = 0x80
+LIST_OFFSET = 0xc0
+
+UTXO_ID_LENGTH = 32
+ADDRESS_LENGTH = 20
+METADATA_LENGTH = 32
+
+# utxo ids, addresses and metadata have a fixed length, so they have a fixed single-byte prefix
+UTXO_ID_PREFIX = STRING_OFFSET + UTXO_ID_LENGTH
+ADDRESS_PREFIX = STRING_OFFSET + ADDRESS_LENGTH
+METADATA_PREFIX = STRING_OFFSET + METADATA_LENGTH
+ENCODED_UTXO_ID_LENGTH = 1 + UTXO_ID_LENGTH
+ENCODED_ADDRESS_LENGTH = 1 + ADDRESS_LENGTH
+ENCODED_METADATA_LENGTH = 1 + METADATA_LENGTH
+
+
+def encode_transaction(tx, max_inputs=5, max_outputs=5):
+    """ Encodes a transaction, raises ValueError when it does not fit the Payment schema """
+    if len(tx.inputs) > max_inputs or len(tx.outputs) > max_outputs:
+        raise ValueError('too many inputs or outputs')
+    identifiers = [tx_input.identifier for tx_input in tx.inputs]
+    outputs = [(output.output_type, output.output_guard, output.token, output.amount) for output in tx.outputs]
+    return _encode_payment(tx.tx_type, identifiers, outputs, tx.tx_data, tx.metadata)
+
+
+def encode_transactions(input_offsets, input_positions, output_offsets, owners, tokens, amounts,
+                        tx_type=1, output_type=1, tx_data=0, metadata=EMPTY_METADATA, max_inputs=5, max_outputs=5):
+    """ Encodes many Payment transactions given as columns, yields (encoded transaction, hash) pairs.
+
+        Inputs of i-th transaction are utxo positions input_positions[input_offsets[i]:input_offsets[i + 1]],
+        its outputs are given by owners, tokens and amounts between output_offsets[i] and output_offsets[i + 1].
+        Owners and tokens may be given in any form accepted by canonical_address, each distinct address
+        is normalized once.
+    """
+    if len(input_offsets) != len(output_offsets):
+        raise ValueError('input and output offsets must describe the same number of transactions')
+    if not len(owners) == len(tokens) == len(amounts):
+        raise ValueError('owners, tokens and amounts must have the same length')
+
+    for i in range(len(input_offsets) - 1):
+        input_start, input_end = input_offsets[i], input_offsets[i + 1]
+        output_start, output_end = output_offsets[i], output_offsets[i + 1]
+        if input_end - input_start > max_inputs or output_end - output_start > max_outputs:
+            raise ValueError('too many inputs or outputs')
+        outputs = [(output_type, canonical_address(owners[j]), canonical_address(tokens[j]), amounts[j])
+                   for j in range(output_start, output_end)]
+        encoded = _encode_payment(tx_type, input_positions[input_start:input_end], outputs, tx_data, metadata)
+        yield encoded, keccak(encoded)
+
+
+def _encode_payment(tx_type, identifiers, outputs, tx_data, metadata):
+    if len(metadata) != METADATA_LENGTH:
+        raise ValueError('metadata must be 32 bytes long')
+
+    tx_type = _encode_uint(tx_type)
+    tx_data = _encode_uint(tx_data)
+
+    encoded_outputs = []
+    outputs_length = 0
+    for output_type, output_guard, token, amount in outputs:
+        if len(output_guard) != ADDRESS_LENGTH or len(token) != ADDRESS_LENGTH:
+            raise ValueError('output guard and token must be 20 bytes long')
+        output_type = _encode_uint(output_type)
+        amount = _encode_uint(amount)
+
+        fields_length = 2 * ENCODED_ADDRESS_LENGTH + len(amount)
+        output_length = len(output_type) + _prefix_length(fields_length) + fields_length
+        encoded_outputs.append((output_type, output_guard, token, amount, fields_length, output_length))
+        outputs_length += _prefix_length(output_length) + output_length
+
+    inputs_length = len(identifiers) * ENCODED_UTXO_ID_LENGTH
+    payload_length = (len(tx_type)
+                      + _prefix_length(inputs_length) + inputs_length
+                      + _prefix_length(outputs_length) + outputs_length
+                      + len(tx_data)
+                      + ENCODED_METADATA_LENGTH)
+
+    buffer = bytearray(_prefix_length(payload_length) + payload_length)
+    offset = _write_list_prefix(buffer, 0, payload_length)
+    buffer[offset:offset + len(tx_type)] = tx_type
+    offset += len(tx_type)
+
+    offset = _write_list_prefix(buffer, offset, inputs_length)
+    for identifier in identifiers:
+        if type(identifier) is not int or identifier < 0 or identifier.bit_length() > UTXO_ID_LENGTH * 8:
+            raise ValueError('utxo position does not fit in 32 bytes')
+        buffer[offset] = UTXO_ID_PREFIX
+        buffer[offset + 1:offset + ENCODED_UTXO_ID_LENGTH] = identifier.to_bytes(UTXO_ID_LENGTH, 'big')
+        offset += ENCODED_UTXO_ID_LENGTH
+
+    offset = _write_list_prefix(buffer, offset, outputs_length)
+    for output_type, output_guard, token, amount, fields_length, output_length in encoded_outputs:
+        offset = _write_list_prefix(buffer, offset, output_length)
+        buffer[offset:offset + len(output_type)] = output_type
+        offset = _write_list_prefix(buffer, offset + len(output_type), fields_length)
+        buffer[offset] = ADDRESS_PREFIX
+        buffer[offset + 1:offset + ENCODED_ADDRESS_LENGTH] = output_guard
+        offset += ENCODED_ADDRESS_LENGTH
+        buffer[offset] = ADDRESS_PREFIX
+        buffer[offset + 1:offset + ENCODED_ADDRESS_LENGTH] = token
+        offset += ENCODED_ADDRESS_LENGTH
+        buffer[offset:offset + len(amount)] = amount
+        offset += len(amount)
+
+    buffer[offset:offset + len(tx_data)] = tx_data
+    offset += len(tx_data)
+    buffer[offset] = METADATA_PREFIX
+    buffer[offset + 1:] = metadata
+    return bytes(buffer)
+
+
+def _encode_uint(value):
+    """ Encodes an integer the way big_endian_int sedes does, prefix included """
+    if type(value) is not int or value < 0:
+        raise ValueError('only non-negative integers can be encoded')
+    if value == 0:
+        return bytes([STRING_OFFSET])
+    if value < STRING_OFFSET:
+        return bytes([value])
+
+    payload = value.to_bytes((value.bit_length() + 7) // 8, 'big')
+    if len(payload) <= SHORT_LENGTH_LIMIT:
+        return bytes([STRING_OFFSET + len(payload)]) + payload
+    length = _length_bytes(len(payload))
+    return bytes([STRING_OFFSET + SHORT_LENGTH_LIMIT + len(length)]) + length + payload
+
+
+def _length_bytes(length):
+    return length.to_bytes((length.bit_length() + 7) // 8, 'big')
+
+
+def _prefix_length(payload_length):
+    if payload_length <= SHORT_LENGTH_LIMIT:
+        return 1
+    return 1 + len(_length_bytes(payload_length))
+
+
+def _write_list_prefix(buffer, offset, payload_length):
+    if payload_length <= SHORT_LENGTH_LIMIT:
+        buffer[offset] = LIST_OFFSET + payload_length
+        return offset + 1
+
+    length = _length_bytes(payload_length)
+    buffer[offset] = LIST_OFFSET + SHORT_LENGTH_LIMIT + len(length)
+    buffer[offset + 1:offset + 1 + len(length)] = length
+    return offset + 1 + len(length)
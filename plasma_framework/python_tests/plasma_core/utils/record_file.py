@@ -0,0 +1,77 @@
+import os
+
+
+class RecordFile(object):
+    """ Append-only file of block records, indexed by block number.
+
+        Each record starts with a RECORD_HEADER whose first two fields are MAGIC and the block number,
+        followed by a body whose length subclasses derive from the header. Opening the file reads only
+        the record headers. A record left incomplete by an interrupted append is cut off on open.
+    """
+
+    MAGIC = None
+    RECORD_HEADER = None
+    DESCRIPTION = 'record file'
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'a+b')
+        self._records = {}
+        self._load_index()
+
+    def append(self, block):
+        if block.number in self._records:
+            raise ValueError(f'block {block.number} is already in the {self.DESCRIPTION}')
+
+        record = self._record(block)
+        self._file.seek(0, os.SEEK_END)
+        position = self._file.tell()
+        self._file.write(record)
+        self._file.flush()
+        self._records[block.number] = position
+
+    def __contains__(self, blknum):
+        return blknum in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _record(self, block):
+        """ Returns the header and body of the record of the block """
+        raise NotImplementedError
+
+    def _body_length(self, header):
+        raise NotImplementedError
+
+    def _load_index(self):
+        size = os.fstat(self._file.fileno()).st_size
+        position = 0
+        while position + self.RECORD_HEADER.size <= size:
+            header = self._read_header(position)
+            if header[0] != self.MAGIC:
+                self._file.close()
+                raise ValueError(f'{self.path} is not a {self.DESCRIPTION} file')
+            end = position + self.RECORD_HEADER.size + self._body_length(header)
+            if end > size:
+                break
+            self._records[header[1]] = position
+            position = end
+
+        if position < size:
+            self._file.truncate(position)
+
+    def _read_header(self, position):
+        return self.RECORD_HEADER.unpack(self._read_at(position, self.RECORD_HEADER.size))
+
+    def _read_at(self, position, length):
+        self._file.seek(position)
+        return self._file.read(length)
@@ -0,0 +1,72 @@
+from eth_keys.datatypes import Signature
+from eth_keys.exceptions import BadSignature, ValidationError
+
+from plasma_core.constants import NULL_ADDRESS, NULL_SIGNATURE
+from plasma_core.utils import ecdsa
+from plasma_core.utils.eip712_struct_hash import hash_struct
+
+# batches are spread over workers only when recovering them in place costs clearly more than shipping them:
+# a recovery takes milliseconds with the native backend, but tens of microseconds with coincurve
+PARALLEL_THRESHOLDS = {'coincurve': 4096, 'native': 64}
+CHUNK_SIZES = {'coincurve': 1024, 'native': 16}
+V_OFFSET = 27
+
+
+def recover_signers(pairs, executor=None):
+    """ Recovers the signer addresses of (msg_hash, signature) pairs.
+
+        Signatures are expected in the form produced by amend_signature, with v of 27 or 28.
+        A null or invalid signature recovers to the null address.
+        With an executor (a long-lived process pool), batches of at least the parallel threshold
+        of the ECDSA backend in use are split into chunks over its workers.
+    """
+    pairs = list(pairs)
+    if executor is None or len(pairs) < PARALLEL_THRESHOLDS[ecdsa.backend]:
+        return _recover_chunk(pairs)
+
+    chunk_size = CHUNK_SIZES[ecdsa.backend]
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    return [signer for signers in executor.map(_recover_chunk, chunks) for signer in signers]
+
+
+class SignerRecovery(object):
+    """ Recovers signers of transactions from their signatures, instead of trusting Transaction.signers.
+
+        Messages are hashed in the calling process, the signatures of all the transactions
+        of a block are then recovered as one batch, on the executor when one is given.
+        The executor is owned by the caller, so that its workers are reused across blocks.
+    """
+
+    def __init__(self, verifying_contract=None, executor=None):
+        self.verifying_contract = verifying_contract
+        self.executor = executor
+
+    def recover_transactions(self, transactions):
+        """ Returns the list of signers of every transaction """
+        pairs = []
+        for tx in transactions:
+            msg_hash = hash_struct(tx, verifying_contract=self.verifying_contract)
+            pairs.extend((msg_hash, signature) for signature in tx.signatures)
+
+        signers = recover_signers(pairs, executor=self.executor)
+        result = []
+        offset = 0
+        for tx in transactions:
+            result.append(signers[offset:offset + len(tx.signatures)])
+            offset += len(tx.signatures)
+        return result
+
+
+def _recover_chunk(pairs):
+    return [_recover(msg_hash, signature) for msg_hash, signature in pairs]
+
+
+def _recover(msg_hash, signature):
+    if signature == NULL_SIGNATURE or len(signature) != len(NULL_SIGNATURE):
+        return NULL_ADDRESS
+    try:
+        # reverts amend_signature, eth_keys expects v of 0 or 1
+        signature = (int.from_bytes(signature, 'big') - V_OFFSET).to_bytes(len(signature), 'big')
+        return ecdsa.recover_public_key(msg_hash, Signature(signature)).to_canonical_address()
+    except (OverflowError, BadSignature, ValidationError):
+        return NULL_ADDRESS
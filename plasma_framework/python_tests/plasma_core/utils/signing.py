@@ -0,0 +1,43 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def sign_many(transactions, accounts, verifying_contract=None, workers=None, processes=False):
+    """ Signs every input of many transactions, i-th input of k-th transaction with accounts[k][i].
+
+        Transactions are signed in place, spread over a pool of the given number of threads,
+        or of processes when processes is set. EIP-712 hashing keeps no shared mutable state,
+        so transactions can be signed concurrently. Returns the transactions.
+    """
+    transactions = list(transactions)
+    accounts = list(accounts)
+    if len(transactions) != len(accounts):
+        raise ValueError('every transaction needs its list of accounts')
+
+    if not workers:
+        for tx, tx_accounts in zip(transactions, accounts):
+            _sign(tx, tx_accounts, verifying_contract)
+        return transactions
+
+    if not processes:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_sign, transactions, accounts, [verifying_contract] * len(transactions)))
+        return transactions
+
+    # transactions signed by workers are copies, so their signatures are copied back
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        signed = executor.map(_signatures, transactions, accounts, [verifying_contract] * len(transactions),
+                              chunksize=max(1, len(transactions) // (4 * workers)))
+        for tx, (signatures, signers) in zip(transactions, signed):
+            tx.signatures[:] = signatures
+            tx.signers[:] = signers
+    return transactions
+
+
+def _sign(tx, accounts, verifying_contract):
+    for index, account in enumerate(accounts):
+        tx.sign(index, account, verifying_contract=verifying_contract)
+
+
+def _signatures(tx, accounts, verifying_contract):
+    _sign(tx, accounts, verifying_contract)
+    return tx.signatures, tx.signers
@@ -222,10 +222,10 @@ class TestingLanguage:
         return self.start_standard_exit_with_tx_body(output_id, output_tx, account, bond, block)
 
     def start_standard_exit_with_tx_body(self, output_id, output_tx, account, bond=None, block=None):
-        transactions = [output_tx]
         if block:
-            transactions = block.transactions
-        merkle = FixedMerkle(16, list(map(lambda tx: tx.encoded, transactions)))
+            merkle = block.merklized_transaction_set
+        else:
+            merkle = FixedMerkle(Block.MERKLE_DEPTH, [output_tx.encoded])
         proof = merkle.create_membership_proof(output_tx.encoded)
         bond = bond if bond is not None else self.root_chain.standardExitBond()
         self.root_chain.startStandardExit(output_id, output_tx.encoded, proof,
@@ -395,11 +395,10 @@ class TestingLanguage:
         return self.root_chain.getInFlightExitId(spend_tx.encoded)
 
     def get_merkle_proof(self, tx_id):
-        tx = self.child_chain.get_transaction(tx_id)
-        (blknum, _, _) = decode_utxo_id(tx_id)
+        (blknum, txindex, _) = decode_utxo_id(tx_id)
         block = self.child_chain.get_block(blknum)
         merkle = block.merklized_transaction_set
-        return merkle.create_membership_proof(tx.encoded)
+        return merkle.create_membership_proof_at(txindex)
 
     def piggyback_in_flight_exit_input(self, tx_id, input_index, account, bond=None, spend_tx=None):
         if spend_tx is None:
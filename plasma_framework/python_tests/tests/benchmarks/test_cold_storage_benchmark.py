@@ -0,0 +1,90 @@
+import os
+import random
+
+import pytest
+
+from plasma_core.block import Block
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+from plasma_core.utils.block_archive import BlockArchive
+from plasma_core.utils.cold_storage import CODECS, ColdBlockStore
+from tests_utils.benchmark import measure_time, write_report
+
+pytestmark = pytest.mark.benchmark
+
+CHILD_BLOCKS = 100
+TRANSACTIONS_PER_BLOCK = 100
+OWNERS = 1000
+CACHE_SIZE = 16
+READS = 1000
+
+
+def make_blocks(rng):
+    """ Alternates child blocks of payments with single-transaction deposit blocks """
+    owners = [rng.getrandbits(160).to_bytes(20, 'big') for _ in range(OWNERS)]
+    tokens = [NULL_ADDRESS, rng.getrandbits(160).to_bytes(20, 'big')]
+
+    def payment(blknum):
+        inputs = [(rng.randrange(1, blknum // 1000 + 1) * 1000, rng.randrange(TRANSACTIONS_PER_BLOCK), rng.randrange(2))
+                  for _ in range(rng.randint(1, 2))]
+        outputs = [(rng.choice(owners), rng.choice(tokens), rng.randrange(10 ** 18)) for _ in range(rng.randint(1, 3))]
+        return Transaction(inputs=inputs, outputs=outputs)
+
+    blocks = []
+    for i in range(1, CHILD_BLOCKS + 1):
+        blocks.append(Block([Transaction(outputs=[(rng.choice(owners), rng.choice(tokens), rng.randrange(10 ** 18))])],
+                            number=(i - 1) * 1000 + 1))
+        blocks.append(Block([payment(i * 1000) for _ in range(TRANSACTIONS_PER_BLOCK)], number=i * 1000))
+    return blocks
+
+
+def access_patterns(rng, blknums):
+    recent = blknums[-CACHE_SIZE // 2:]
+    return {
+        'sequential': [blknums[i % len(blknums)] for i in range(READS)],
+        'uniform': [rng.choice(blknums) for _ in range(READS)],
+        'recent': [rng.choice(recent) for _ in range(READS)],
+    }
+
+
+def benchmark_reads(get_block, pattern):
+    def read():
+        for blknum in pattern:
+            get_block(blknum)
+    return measure_time(read) / len(pattern)
+
+
+def test_cold_storage_benchmark(tmp_path):
+    rng = random.Random(0)
+    blocks = make_blocks(rng)
+    blknums = [block.number for block in blocks]
+    patterns = access_patterns(rng, blknums)
+    raw_size = sum(len(block.encoded) for block in blocks)
+    results = []
+
+    with BlockArchive(str(tmp_path / 'blocks.archive')) as archive:
+        for block in blocks:
+            archive.append(block)
+        result = {'codec': 'none', 'compression_ratio': 1.0}
+        for name, pattern in patterns.items():
+            result[f'{name}_read_s'] = benchmark_reads(archive.get_block, pattern)
+        results.append(result)
+
+    for codec in CODECS:
+        path = str(tmp_path / f'blocks.{codec}')
+        with ColdBlockStore(path, codec=codec, cache_size=CACHE_SIZE) as store:
+            append_s = measure_time(lambda: [store.append(block) for block in blocks])
+            result = {
+                'codec': codec,
+                'compression_ratio': raw_size / os.path.getsize(path),
+                'append_s': append_s / len(blocks),
+            }
+            for name, pattern in patterns.items():
+                store._cache.clear()
+                result[f'{name}_read_s'] = benchmark_reads(store.get_block, pattern)
+            results.append(result)
+
+    path = write_report('cold_storage', results, blocks=len(blocks), raw_bytes=raw_size, cache_size=CACHE_SIZE, reads=READS)
+    print(f'Cold storage benchmark report written to {path}')
+    for result in results:
+        print(result)
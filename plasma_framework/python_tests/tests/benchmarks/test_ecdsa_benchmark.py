@@ -0,0 +1,57 @@
+import pytest
+from eth_keys.datatypes import PrivateKey
+
+from plasma_core.utils import ecdsa
+from tests_utils.backends import restored_backend
+from tests_utils.benchmark import measure_time, write_report
+
+pytestmark = pytest.mark.benchmark
+
+OPERATIONS = 200
+
+
+def benchmark_backend():
+    keys = [PrivateKey(i.to_bytes(32, 'big')) for i in range(1, OPERATIONS + 1)]
+    msg_hashes = [i.to_bytes(32, 'big') for i in range(OPERATIONS)]
+    signatures = [ecdsa.sign(msg_hash, key) for msg_hash, key in zip(msg_hashes, keys)]
+
+    def sign():
+        for msg_hash, key in zip(msg_hashes, keys):
+            ecdsa.sign(msg_hash, key)
+
+    def recover():
+        for msg_hash, signature in zip(msg_hashes, signatures):
+            ecdsa.recover_public_key(msg_hash, signature)
+
+    def sign_and_recover_signer():
+        for msg_hash, key in zip(msg_hashes, keys):
+            ecdsa.recover_public_key(msg_hash, ecdsa.sign(msg_hash, key)).to_canonical_address()
+
+    def sign_and_derive_signer():
+        for msg_hash, key in zip(msg_hashes, keys):
+            ecdsa.sign(msg_hash, key)
+            key.public_key.to_canonical_address()
+
+    return {
+        'backend': ecdsa.backend,
+        'sign_per_s': OPERATIONS / measure_time(sign),
+        'recover_per_s': OPERATIONS / measure_time(recover),
+        'sign_and_recover_signer_per_s': OPERATIONS / measure_time(sign_and_recover_signer),
+        'sign_and_derive_signer_per_s': OPERATIONS / measure_time(sign_and_derive_signer),
+    }
+
+
+def test_ecdsa_benchmark():
+    results = []
+    with restored_backend(ecdsa):
+        for name, _ in ecdsa.BACKENDS:
+            try:
+                ecdsa.use_backend(name)
+            except ImportError:
+                continue
+            results.append(benchmark_backend())
+
+    path = write_report('ecdsa', results, operations=OPERATIONS)
+    print(f'ECDSA benchmark report written to {path}')
+    for result in results:
+        print(result)
@@ -0,0 +1,68 @@
+import pytest
+
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from tests_utils.benchmark import measure_peak_memory, measure_time, write_report
+
+pytestmark = pytest.mark.benchmark
+
+FILL_LEVELS = [1, 100, 10000, 65536]
+PROOF_SAMPLE_SIZE = 100
+OWNER = b'\x01' * 20
+
+
+@pytest.fixture
+def merkle_wrapper(get_contract):
+    return get_contract('MerkleWrapper')
+
+
+def sample_indices(num_leaves):
+    step = max(num_leaves // PROOF_SAMPLE_SIZE, 1)
+    return list(range(0, num_leaves, step))[:PROOF_SAMPLE_SIZE]
+
+
+def benchmark_fill_level(depth, num_leaves, merkle_wrapper):
+    leaves = [Transaction(outputs=[(OWNER, NULL_ADDRESS, amount)]).encoded for amount in range(1, num_leaves + 1)]
+    merkle = FixedMerkle(depth, leaves)
+    indices = sample_indices(num_leaves)
+    proofs = [merkle.create_membership_proof_at(index) for index in indices]
+
+    def create_proofs_by_leaf():
+        for index in indices:
+            merkle.create_membership_proof(leaves[index])
+
+    def create_proofs_by_index():
+        for index in indices:
+            merkle.create_membership_proof_at(index)
+
+    def verify_proofs():
+        for index, proof in zip(indices, proofs):
+            assert merkle.check_membership(leaves[index], index, proof)
+
+    gas = []
+    for index, proof in zip(indices[:1] + indices[-1:], proofs[:1] + proofs[-1:]):
+        check_membership = merkle_wrapper.contract.functions.checkMembership(leaves[index], index, merkle.root, proof)
+        assert check_membership.call()
+        gas.append(check_membership.estimateGas())
+
+    return {
+        'leaves': num_leaves,
+        'root_build_s': measure_time(lambda: FixedMerkle(depth, leaves)),
+        'proof_by_leaf_s': measure_time(create_proofs_by_leaf) / len(indices),
+        'proof_by_index_s': measure_time(create_proofs_by_index) / len(indices),
+        'proof_verification_s': measure_time(verify_proofs) / len(indices),
+        'peak_memory_bytes': measure_peak_memory(lambda: FixedMerkle(depth, leaves)),
+        'check_membership_gas': max(gas),
+    }
+
+
+@pytest.mark.parametrize("depth", [8, 16])
+def test_fixed_merkle_benchmark(depth, merkle_wrapper):
+    fill_levels = sorted({min(num_leaves, 2 ** depth) for num_leaves in FILL_LEVELS})
+    results = [benchmark_fill_level(depth, num_leaves, merkle_wrapper) for num_leaves in fill_levels]
+
+    path = write_report(f'fixed_merkle_depth_{depth}', results, depth=depth, proof_sample_size=PROOF_SAMPLE_SIZE)
+    print(f'FixedMerkle benchmark report written to {path}')
+    for result in results:
+        print(result)
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from plasma_core.utils.merkle.multiproof import check_multiproof, create_multiproof
+from tests_utils.benchmark import measure_time, write_report
+
+pytestmark = pytest.mark.benchmark
+
+DEPTH = 16
+FILL_LEVELS = [100, 10000, 65536]
+PROVEN_LEAVES = [2, 5, 20, 100, 1000]
+
+
+def benchmark_multiproof(merkle, leaves, indices):
+    multiproof = create_multiproof(merkle, indices)
+    proven_leaves = [leaves[index] for index in multiproof.indices]
+    proofs = [merkle.create_membership_proof_at(index) for index in indices]
+
+    def check_independent_proofs():
+        for index, proof in zip(indices, proofs):
+            assert merkle.check_membership(leaves[index], index, proof)
+
+    return {
+        'leaves': len(leaves),
+        'proven_leaves': len(indices),
+        'multiproof_bytes': len(multiproof.encode()),
+        'independent_proofs_bytes': sum(len(proof) for proof in proofs),
+        'multiproof_creation_s': measure_time(lambda: create_multiproof(merkle, indices)),
+        'independent_proofs_creation_s': measure_time(lambda: merkle.create_membership_proofs(indices)),
+        'multiproof_check_s': measure_time(lambda: check_multiproof(proven_leaves, merkle.root, multiproof, DEPTH)),
+        'independent_proofs_check_s': measure_time(check_independent_proofs),
+    }
+
+
+def test_multiproof_benchmark():
+    rng = random.Random(0)
+    results = []
+    for num_leaves in FILL_LEVELS:
+        leaves = [index.to_bytes(4, 'big') for index in range(num_leaves)]
+        merkle = FixedMerkle(DEPTH, leaves)
+        for num_proven in PROVEN_LEAVES:
+            if num_proven <= num_leaves:
+                indices = sorted(rng.sample(range(num_leaves), num_proven))
+                results.append(benchmark_multiproof(merkle, leaves, indices))
+
+    path = write_report('multiproof', results, depth=DEPTH)
+    print(f'Multiproof benchmark report written to {path}')
+    for result in results:
+        print(result)
@@ -0,0 +1,47 @@
+import random
+import tracemalloc
+
+import pytest
+from eth_utils import to_checksum_address
+
+from plasma_core.transaction import TransactionInput, TransactionOutput
+from tests_utils.benchmark import write_report
+
+pytestmark = pytest.mark.benchmark
+
+UTXOS = 100000
+OWNERS = 1000
+TOKENS = 3
+
+
+def measure_allocated_memory(create):
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = create()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def test_utxo_memory_benchmark():
+    rng = random.Random(0)
+    # addresses come as checksum strings from the accounts, as in the testlang
+    owners = [to_checksum_address(rng.getrandbits(160).to_bytes(20, 'big')) for _ in range(OWNERS)]
+    tokens = [to_checksum_address(rng.getrandbits(160).to_bytes(20, 'big')) for _ in range(TOKENS)]
+    outputs = [(rng.choice(owners), rng.choice(tokens), rng.randint(1, 10 ** 20)) for _ in range(UTXOS)]
+    inputs = [(rng.randint(1, 10 ** 6) * 1000, rng.randint(0, 9999), rng.randint(0, 4)) for _ in range(UTXOS)]
+
+    output_bytes = measure_allocated_memory(lambda: [TransactionOutput(*o) for o in outputs])
+    input_bytes = measure_allocated_memory(lambda: [TransactionInput(*i) for i in inputs])
+
+    results = {
+        'utxos': UTXOS,
+        'bytes_per_output': output_bytes / UTXOS,
+        'bytes_per_input': input_bytes / UTXOS,
+    }
+    path = write_report('utxo_memory', results, owners=OWNERS, tokens=TOKENS)
+    print(f'UTXO memory benchmark report written to {path}')
+    print(results)
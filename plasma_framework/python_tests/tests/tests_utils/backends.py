@@ -0,0 +1,22 @@
+from contextlib import contextmanager
+
+import pytest
+
+
+@contextmanager
+def restored_backend(module):
+    """ Switches the module (e.g. plasma_core.utils.keccak) back to its current backend on exit """
+    default_backend = module.backend
+    try:
+        yield
+    finally:
+        module.use_backend(default_backend)
+
+
+def restore_backend_fixture(module):
+    """ Returns a fixture restoring the backend of the module after the test """
+    @pytest.fixture
+    def restore_backend():
+        with restored_backend(module):
+            yield
+    return restore_backend
@@ -0,0 +1,56 @@
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+from plasma_core.utils import keccak
+
+OWN_DIR = os.path.dirname(os.path.realpath(__file__))
+REPORT_DIR = os.environ.get('BENCHMARK_REPORT_DIR',
+                            os.path.abspath(os.path.realpath(os.path.join(OWN_DIR, '../../../build/benchmarks'))))
+
+
+def measure_time(fn, repeat=1):
+    """ Returns the average wall time of a call of fn, in seconds """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def measure_peak_memory(fn):
+    """ Returns the peak of memory allocated by Python while fn runs, in bytes """
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=OWN_DIR, stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(name, results, **parameters):
+    """ Writes a JSON report, so that benchmark results can be compared between revisions """
+    report = {
+        'benchmark': name,
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'keccak_backend': keccak.backend,
+        'parameters': parameters,
+        'results': results,
+    }
+
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    path = os.path.join(REPORT_DIR, f'{name}.json')
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    return path
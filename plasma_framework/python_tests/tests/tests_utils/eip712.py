@@ -0,0 +1,80 @@
+from eip712_structs import EIP712Struct, Address, Uint, Bytes, Array
+from eth_abi import encode_abi
+from eth_utils import keccak
+
+from plasma_core.constants import NULL_ADDRESS
+
+# constants of PaymentEip712Lib
+EIP712_DOMAIN_HASH = keccak(text="EIP712Domain(string name,string version,address verifyingContract,bytes32 salt)")
+TX_TYPE_HASH = keccak(text="Transaction(uint256 txType,Input[] inputs,Output[] outputs,uint256 txData,bytes32 metadata)"
+                           "Input(uint256 blknum,uint256 txindex,uint256 oindex)"
+                           "Output(uint256 outputType,bytes20 outputGuard,address currency,uint256 amount)")
+INPUT_TYPE_HASH = keccak(text="Input(uint256 blknum,uint256 txindex,uint256 oindex)")
+OUTPUT_TYPE_HASH = keccak(text="Output(uint256 outputType,bytes20 outputGuard,address currency,uint256 amount)")
+SALT = bytes.fromhex('fad5c7f626d80f9256ef01929f3beb96e058b8b4b0e3fe52d84f054c0e2a7a83')
+
+
+def payment_eip712_hash(tx, verifying_contract=None):
+    """ Reference EIP-712 hash of a Payment transaction, written after PaymentEip712Lib.hashTx """
+    verifying_address = bytes.fromhex(verifying_contract[2:] if verifying_contract[:2] == '0x' else verifying_contract) \
+        if verifying_contract else NULL_ADDRESS
+    domain_separator = keccak(encode_abi(['bytes32', 'bytes32', 'bytes32', 'address', 'bytes32'],
+                                         [EIP712_DOMAIN_HASH, keccak(text='OMG Network'), keccak(text='2'),
+                                          verifying_address, SALT]))
+    inputs = [keccak(encode_abi(['bytes32', 'uint256', 'uint256', 'uint256'],
+                                [INPUT_TYPE_HASH, i.blknum, i.txindex, i.oindex]))
+              for i in tx.inputs]
+    outputs = [keccak(encode_abi(['bytes32', 'uint256', 'bytes20', 'address', 'uint256'],
+                                 [OUTPUT_TYPE_HASH, o.output_type, o.output_guard, o.token, o.amount]))
+               for o in tx.outputs]
+    tx_hash = keccak(encode_abi(['bytes32', 'uint256', 'bytes32', 'bytes32', 'uint256', 'bytes32'],
+                                [TX_TYPE_HASH, tx.tx_type, keccak(b''.join(inputs)), keccak(b''.join(outputs)),
+                                 tx.tx_data, tx.metadata]))
+    return keccak(b'\x19\x01' + domain_separator + tx_hash)
+
+
+# generic EIP-712 structs of a Payment transaction, hashed with the generic struct hasher as a reference
+class Input(EIP712Struct):
+    blknum = Uint(256)
+    txindex = Uint(256)
+    oindex = Uint(256)
+
+
+class Output(EIP712Struct):
+    outputType = Uint(256)
+    outputGuard = Bytes(20)
+    currency = Address()
+    amount = Uint(256)
+
+
+class Transaction(EIP712Struct):
+    txType = Uint(256)
+    inputs = Array(Input)
+    outputs = Array(Output)
+    txData = Uint(256)
+    metadata = Bytes(32)
+
+
+def struct_tx_from_tx(tx):
+    inputs = _map_inputs(tx.inputs)
+    outputs = _map_outputs(tx.outputs)
+
+    return Transaction(
+        txType=tx.tx_type,
+        inputs=inputs,
+        outputs=outputs,
+        txData=tx.tx_data,
+        metadata=tx.metadata,
+    )
+
+
+def _map_inputs(inputs):
+    eip712_inputs = [Input(blknum=i.blknum, txindex=i.txindex, oindex=i.oindex) for i in inputs]
+    return eip712_inputs
+
+
+def _map_outputs(outputs):
+    eip712_outputs = []
+    for o in outputs:
+        eip712_outputs.append(Output(outputType=o.output_type, outputGuard=o.output_guard, currency=o.token, amount=o.amount))
+    return eip712_outputs
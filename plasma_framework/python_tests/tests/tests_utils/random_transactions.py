@@ -0,0 +1,37 @@
+from plasma_core.block import Block
+from plasma_core.transaction import Transaction, TxTypes
+
+
+def random_int(rng):
+    return rng.choice([
+        0,
+        rng.randint(1, 127),
+        rng.randint(128, 255),
+        rng.randint(256, 2 ** 64),
+        rng.randint(2 ** 64, 2 ** 256 - 1),
+    ])
+
+
+def random_address(rng):
+    return rng.getrandbits(160).to_bytes(20, 'big')
+
+
+def random_transaction(rng):
+    inputs = [(rng.randint(0, 2 ** 40), rng.randint(0, 9999), rng.randint(0, 9999))
+              for _ in range(rng.randint(0, Transaction.NUM_INPUTS))]
+    outputs = [(random_address(rng), random_address(rng), random_int(rng), random_int(rng))
+               for _ in range(rng.randint(0, Transaction.NUM_OUTPUTS))]
+    return Transaction(tx_type=TxTypes.PAYMENT,
+                       inputs=inputs,
+                       outputs=outputs,
+                       tx_data=random_int(rng),
+                       metadata=rng.getrandbits(256).to_bytes(32, 'big'))
+
+
+def random_block(rng, number, max_transactions=8):
+    return Block([random_transaction(rng) for _ in range(rng.randint(0, max_transactions))], number=number)
+
+
+def random_blocks(rng, count):
+    """ Returns count random child blocks, numbered 1000, 2000 and so on """
+    return [random_block(rng, number * 1000) for number in range(1, count + 1)]
@@ -0,0 +1,14 @@
+from eth_utils import to_checksum_address
+
+from plasma_core.utils.addresses import canonical_address
+
+
+def test_canonical_address_of_hex_and_bytes_are_the_same_object():
+    raw = bytes(range(20))
+    assert canonical_address(to_checksum_address(raw)) is canonical_address(raw)
+    assert canonical_address(bytes(raw)) is canonical_address(raw)
+    assert canonical_address(bytearray(raw)) is canonical_address(raw)
+
+
+def test_canonical_address_returns_20_bytes():
+    assert canonical_address('0x' + '00' * 20) == b'\x00' * 20
@@ -0,0 +1,54 @@
+import pytest
+from eth_keys.datatypes import PrivateKey
+
+from plasma_core.block import Block, MerkleCache, merkle_cache
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+
+OWNER = b'\x01' * 20
+
+
+@pytest.fixture
+def block():
+    merkle_cache.clear()
+    return Block([Transaction(outputs=[(OWNER, NULL_ADDRESS, amount)]) for amount in range(1, 4)], number=1000)
+
+
+def test_tree_is_built_once(block):
+    assert block.merklized_transaction_set is block.merklized_transaction_set
+    assert block.root == block.merklized_transaction_set.root
+
+
+def test_signed_block_shares_tree(block):
+    merkle = block.merklized_transaction_set
+    signed_block = block.sign(PrivateKey(b'\x01' * 32))
+
+    assert signed_block.merklized_transaction_set is merkle
+    assert signed_block.root == block.root
+
+
+def test_cache_is_bounded():
+    cache = MerkleCache(max_size=2)
+    blocks = [Block([Transaction(outputs=[(OWNER, NULL_ADDRESS, amount)])]) for amount in range(1, 4)]
+    trees = [object() for _ in blocks]
+    for block, tree in zip(blocks, trees):
+        cache.put(block, tree)
+
+    assert cache.get(blocks[0]) is None
+    assert cache.get(blocks[1]) is trees[1]
+    assert cache.get(blocks[2]) is trees[2]
+
+
+def test_evicted_tree_is_rebuilt(block):
+    merkle = block.merklized_transaction_set
+    merkle_cache.clear()
+
+    assert block.merklized_transaction_set is not merkle
+    assert block.merklized_transaction_set.root == merkle.root
+
+
+def test_create_membership_proofs_of_generated_indices(block):
+    proofs = block.create_membership_proofs(index for index in [0, 2])
+
+    assert len(proofs) == 2
+    assert proofs[1] == block.merklized_transaction_set.create_membership_proof_at(2)
@@ -0,0 +1,91 @@
+import os
+import random
+
+import pytest
+
+from plasma_core.account import EthereumAccount
+from plasma_core.block import Block
+from plasma_core.child_chain import ChildChain
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+from plasma_core.utils.block_archive import BlockArchive
+from plasma_core.utils.transactions import encode_utxo_id
+from tests_utils.random_transactions import random_blocks
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    return str(tmp_path / 'blocks.archive')
+
+
+def test_get_transaction_and_block(archive_path):
+    blocks = random_blocks(random.Random(0), 5)
+    with BlockArchive(archive_path) as archive:
+        for block in blocks:
+            archive.append(block)
+
+        for block in blocks:
+            assert archive.root(block.number) == block.root
+            assert archive.get_block(block.number).encoded == block.encoded
+            assert archive.get_block(block.number)._root == block.root  # read from the record, not recomputed
+            for txindex, tx in enumerate(block.transactions):
+                assert archive.get_transaction(encode_utxo_id(block.number, txindex, 0)).encoded == tx.encoded
+
+
+def test_reopened_archive_keeps_blocks(archive_path):
+    blocks = random_blocks(random.Random(1), 3)
+    with BlockArchive(archive_path) as archive:
+        for block in blocks:
+            archive.append(block)
+
+    with BlockArchive(archive_path) as archive:
+        assert len(archive) == 3
+        assert [archive.root(block.number) for block in blocks] == [block.root for block in blocks]
+
+
+def test_incomplete_record_is_cut_off(archive_path):
+    blocks = random_blocks(random.Random(2), 2)
+    with BlockArchive(archive_path) as archive:
+        archive.append(blocks[0])
+    complete_size = os.path.getsize(archive_path)
+    with BlockArchive(archive_path) as archive:
+        archive.append(blocks[1])
+    with open(archive_path, 'r+b') as f:
+        f.truncate(os.path.getsize(archive_path) - 1)
+
+    with BlockArchive(archive_path) as archive:
+        assert blocks[0].number in archive
+        assert blocks[1].number not in archive
+        assert os.path.getsize(archive_path) == complete_size
+        archive.append(blocks[1])
+        assert archive.get_block(blocks[1].number).encoded == blocks[1].encoded
+
+
+def test_missing_block_and_transaction(archive_path):
+    with BlockArchive(archive_path) as archive:
+        archive.append(Block([Transaction()], number=1000))
+        with pytest.raises(KeyError):
+            archive.get_transaction(encode_utxo_id(2000, 0, 0))
+        with pytest.raises(KeyError):
+            archive.get_transaction(encode_utxo_id(1000, 1, 0))
+        with pytest.raises(ValueError):
+            archive.append(Block(number=1000))
+
+
+def test_get_from_empty_archive(archive_path):
+    with BlockArchive(archive_path) as archive:
+        with pytest.raises(KeyError):
+            archive.root(1000)
+        with pytest.raises(KeyError):
+            archive.get_block(1000)
+        with pytest.raises(KeyError):
+            archive.get_transaction(encode_utxo_id(1000, 0, 0))
+
+
+def test_child_chain_archives_added_blocks(archive_path):
+    with BlockArchive(archive_path) as archive:
+        child_chain = ChildChain(EthereumAccount(NULL_ADDRESS, None), archive=archive)
+        deposit = Block([Transaction(outputs=[(b'\x01' * 20, NULL_ADDRESS, 100)])], number=1)
+
+        assert child_chain.add_block(deposit)
+        assert archive.get_transaction(encode_utxo_id(1, 0, 0)).encoded == deposit.transactions[0].encoded
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+from eth_keys.datatypes import PrivateKey
+
+from plasma_core.block import Block
+from plasma_core.utils.block_signing import sign_blocks
+from tests_utils.random_transactions import random_blocks
+
+KEY = PrivateKey(b'\x01' * 32)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_signed_blocks_match_block_sign(workers):
+    blocks = random_blocks(random.Random(0), 6)
+
+    signed_blocks = list(sign_blocks(blocks, KEY, workers=workers))
+
+    assert [signed.number for signed in signed_blocks] == [block.number for block in blocks]
+    for block, signed in zip(blocks, signed_blocks):
+        expected = Block(block.transactions, block.number).sign(KEY)
+        assert signed.signature == expected.signature
+        assert signed.hash == expected.hash
+        assert signed.root == expected.root
+        assert signed.signer == KEY.public_key.to_checksum_address()
+
+
+def test_blocks_are_consumed_lazily():
+    blocks = random_blocks(random.Random(0), 10)
+    consumed = []
+
+    def stream():
+        for block in blocks:
+            consumed.append(block)
+            yield block
+
+    signed_blocks = sign_blocks(stream(), KEY, workers=2, max_in_flight=3)
+    first = next(signed_blocks)
+
+    assert first.number == blocks[0].number
+    assert len(consumed) == 3
+    assert len(list(signed_blocks)) == 9
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from plasma_core.utils.block_archive import BlockArchive
+from plasma_core.utils.cold_storage import CODECS, ColdBlockStore, TieredBlockStore
+from plasma_core.utils.transactions import encode_utxo_id
+from tests_utils.random_transactions import random_blocks
+
+
+@pytest.mark.parametrize("codec", list(CODECS))
+def test_blocks_are_read_back(tmp_path, codec):
+    blocks = random_blocks(random.Random(0), 4)
+    path = str(tmp_path / 'blocks.cold')
+    with ColdBlockStore(path, codec=codec) as store:
+        for block in blocks:
+            store.append(block)
+
+    with ColdBlockStore(path, cache_size=2) as store:
+        for block in blocks:
+            assert store.root(block.number) == block.root
+            assert store.get_block(block.number).encoded == block.encoded
+            assert store.get_block(block.number).root == block.root
+            for txindex, tx in enumerate(block.transactions):
+                assert store.get_transaction(encode_utxo_id(block.number, txindex, 0)).encoded == tx.encoded
+        assert list(store._cache) == [blocks[-2].number, blocks[-1].number]
+
+
+def test_unknown_codec(tmp_path):
+    with pytest.raises(ValueError):
+        ColdBlockStore(str(tmp_path / 'blocks.cold'), codec='bz2')
+
+
+def test_tiered_store_moves_old_blocks_to_cold_store(tmp_path):
+    blocks = random_blocks(random.Random(1), 5)
+    with ColdBlockStore(str(tmp_path / 'blocks.cold')) as cold_store:
+        store = TieredBlockStore(cold_store, hot_blocks=2)
+        for block in blocks:
+            store.add(block)
+
+        assert len(cold_store) == 3
+        assert all(block.number in store for block in blocks)
+        assert store.get_block(blocks[-1].number) is blocks[-1]
+        assert store.get_block(blocks[0].number).encoded == blocks[0].encoded
+
+
+def test_other_record_file_is_rejected(tmp_path):
+    path = str(tmp_path / 'blocks.archive')
+    with BlockArchive(path) as archive:
+        archive.append(random_blocks(random.Random(2), 1)[0])
+
+    with pytest.raises(ValueError):
+        ColdBlockStore(path)
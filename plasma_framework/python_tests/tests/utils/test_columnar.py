@@ -0,0 +1,67 @@
+import random
+from collections import defaultdict
+
+from plasma_core.block import Block
+from plasma_core.transaction import Transaction
+from plasma_core.utils.columnar import ColumnarOutputs
+from tests_utils.random_transactions import random_address
+
+OWNERS = [random_address(random.Random(i)) for i in range(5)]
+TOKENS = [b'\x00' * 20, b'\x01' * 20]
+
+
+def make_blocks(rng, count=3):
+    blocks = []
+    for number in range(1, count + 1):
+        transactions = []
+        for _ in range(rng.randint(0, 6)):
+            outputs = [(rng.choice(OWNERS), rng.choice(TOKENS), rng.randint(0, 2 ** 256 - 1))
+                       for _ in range(rng.randint(0, Transaction.NUM_OUTPUTS))]
+            transactions.append(Transaction(inputs=[(number, 0, 0)], outputs=outputs))
+        blocks.append(Block(transactions, number=number * 1000))
+    return blocks
+
+
+def test_columns_match_outputs():
+    blocks = make_blocks(random.Random(0))
+    columns = ColumnarOutputs(blocks)
+
+    expected = [(block.number, txindex, oindex, output)
+                for block in blocks
+                for txindex, tx in enumerate(block.transactions)
+                for oindex, output in enumerate(tx.outputs)]
+    assert len(columns) == len(expected)
+    for i, (blknum, txindex, oindex, output) in enumerate(expected):
+        assert (columns.blknum[i], columns.txindex[i], columns.oindex[i]) == (blknum, txindex, oindex)
+        assert columns.owners[columns.owner_ids[i]] == output.output_guard
+        assert columns.tokens[columns.token_ids[i]] == output.token
+        assert columns.amounts[i] == output.amount
+
+
+def test_sums_match_loop_over_outputs():
+    rng = random.Random(1)
+    for _ in range(20):
+        blocks = make_blocks(rng)
+        columns = ColumnarOutputs(blocks)
+        by_owner = defaultdict(int)
+        by_owner_in_token = defaultdict(int)
+        by_token = defaultdict(int)
+        for block in blocks:
+            for tx in block.transactions:
+                for output in tx.outputs:
+                    by_owner[output.output_guard] += output.amount
+                    by_token[output.token] += output.amount
+                    if output.token == TOKENS[1]:
+                        by_owner_in_token[output.output_guard] += output.amount
+
+        assert columns.sum_by_owner() == by_owner
+        assert columns.sum_by_owner(token=TOKENS[1]) == by_owner_in_token
+        assert columns.sum_by_token() == by_token
+
+
+def test_empty_and_unknown_token():
+    columns = ColumnarOutputs.from_block(Block())
+    assert len(columns) == 0
+    assert columns.sum_by_owner() == {}
+    assert columns.sum_by_owner(token=b'\x02' * 20) == {}
+    assert columns.sum_by_token() == {}
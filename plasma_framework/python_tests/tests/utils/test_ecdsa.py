@@ -0,0 +1,43 @@
+import pytest
+from eth_keys.datatypes import PrivateKey, Signature
+
+from plasma_core.account import EthereumAccount
+from plasma_core.transaction import Transaction
+from plasma_core.utils import ecdsa
+from plasma_core.utils.eip712_struct_hash import hash_struct
+from tests_utils.backends import restore_backend_fixture
+
+KEY = PrivateKey(b'\x01' * 32)
+MSG_HASH = b'\x02' * 32
+
+
+restore_backend = restore_backend_fixture(ecdsa)
+
+
+@pytest.mark.parametrize("backend", [name for name, _ in ecdsa.BACKENDS])
+def test_backend_matches_eth_keys(backend, restore_backend):
+    try:
+        ecdsa.use_backend(backend)
+    except ImportError:
+        pytest.skip(f'{backend} is not installed')
+
+    signature = ecdsa.sign(MSG_HASH, KEY)
+    assert signature.to_bytes() == KEY.sign_msg_hash(MSG_HASH).to_bytes()
+    assert ecdsa.recover_public_key(MSG_HASH, signature) == KEY.public_key
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError) as e:
+        ecdsa.use_backend('openssl')
+
+    assert str(e.value) == 'unknown ecdsa backend: openssl'
+
+
+def test_signer_is_derived_from_key():
+    tx = Transaction(inputs=[(1000, 0, 0)])
+    tx.sign(0, EthereumAccount(KEY.public_key.to_checksum_address(), KEY))
+
+    # signatures are amended with v of 27 or 28, eth_keys expects 0 or 1
+    signature = Signature(tx.signatures[0][:64] + bytes([tx.signatures[0][64] - 27]))
+    assert tx.signers[0] == KEY.public_key.to_canonical_address()
+    assert ecdsa.recover_public_key(hash_struct(tx), signature) == KEY.public_key
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from plasma_core.transaction import Transaction
+from plasma_core.utils.eip712_struct_hash import TYPE_HASHES, _hash_struct, domain_separator, hash_struct, hash_transaction
+from test_eip712_vectors import inputs, metadata, outputs
+from tests_utils.eip712 import (EIP712_DOMAIN_HASH, INPUT_TYPE_HASH, OUTPUT_TYPE_HASH, TX_TYPE_HASH, payment_eip712_hash,
+                                struct_tx_from_tx)
+from tests_utils.random_transactions import random_transaction
+
+VERIFYING_CONTRACT = '0x44de0ec539b8c4a4b530c78620fe8320167f2f74'
+
+
+def test_type_hashes_match_payment_eip712_lib():
+    assert TYPE_HASHES['EIP712Domain'] == EIP712_DOMAIN_HASH
+    assert TYPE_HASHES['Transaction'] == TX_TYPE_HASH
+    assert TYPE_HASHES['Input'] == INPUT_TYPE_HASH
+    assert TYPE_HASHES['Output'] == OUTPUT_TYPE_HASH
+
+
+def test_domain_separator_is_cached():
+    assert domain_separator(VERIFYING_CONTRACT) is domain_separator(VERIFYING_CONTRACT)
+    assert domain_separator(VERIFYING_CONTRACT) != domain_separator(None)
+
+
+@pytest.mark.parametrize("verifying_contract", [None, VERIFYING_CONTRACT, VERIFYING_CONTRACT[2:]])
+def test_hash_matches_reference(verifying_contract):
+    rng = random.Random(0)
+    for _ in range(100):
+        tx = random_transaction(rng)
+        assert hash_struct(tx, verifying_contract=verifying_contract) == payment_eip712_hash(tx, verifying_contract)
+
+
+def test_direct_hash_matches_generic_struct_hash():
+    rng = random.Random(1)
+    for _ in range(500):
+        tx = random_transaction(rng)
+        assert hash_transaction(tx) == _hash_struct('Transaction', struct_tx_from_tx(tx))
+
+
+def test_hash_of_vector_transactions_matches_reference():
+    for tx in [Transaction(inputs=inputs, outputs=outputs), Transaction(inputs=inputs, outputs=outputs, metadata=metadata)]:
+        assert hash_struct(tx, verifying_contract=VERIFYING_CONTRACT) == payment_eip712_hash(tx, VERIFYING_CONTRACT)
@@ -2,7 +2,8 @@ import math
 import pytest
 from eth_utils import keccak as sha3
 
-from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from plasma_core.utils.merkle.exceptions import MemberNotExistException
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle, get_zero_hashes
 from plasma_core.constants import NULL_HASH
 
 LEAF_SALT = b'\x00'
@@ -47,6 +48,20 @@ def test_empty_tree(depth):
     assert FixedMerkle(depth).root == get_empty_tree_hash(depth)
 
 
+@pytest.mark.parametrize("depth", [1, 2, 16])
+def test_zero_hashes(depth):
+    zero_hashes = get_zero_hashes(depth)
+    assert len(zero_hashes) == depth + 1
+    assert zero_hashes[depth] == get_empty_tree_hash(depth)
+
+
+def test_sparse_tree_matches_padded_tree():
+    depth = 3
+    leaves = [b'a', b'b', b'c']
+    padded_leaves = leaves + [NULL_HASH] * (2 ** depth - len(leaves))
+    assert FixedMerkle(depth, leaves).root == FixedMerkle(depth, padded_leaves).root
+
+
 def test_create_membership_proof():
     leaf = b'c'
     leaves = [b'a', b'b', leaf]
@@ -61,3 +76,58 @@ def test_check_membership():
     merkle = FixedMerkle(2, leaves)
     proof = merkle.create_membership_proof(leaves[2])
     assert merkle.check_membership(leaves[2], 2, proof)
+
+
+def test_create_membership_proof_at():
+    leaves = [b'a', b'b', b'c']
+    merkle = FixedMerkle(2, leaves)
+    assert merkle.create_membership_proof_at(2) == merkle.create_membership_proof(leaves[2])
+
+
+def test_create_membership_proof_of_duplicated_leaf():
+    leaves = [b'a', b'b', b'a']
+    merkle = FixedMerkle(2, leaves)
+    assert merkle.create_membership_proof(b'a') == merkle.create_membership_proof_at(0)
+
+
+def test_create_membership_proof_for_non_existing_leaf():
+    merkle = FixedMerkle(2, [b'a', b'b', b'c'])
+    with pytest.raises(MemberNotExistException):
+        merkle.create_membership_proof(b'd')
+
+
+def test_create_membership_proof_at_out_of_range_index():
+    depth = 2
+    merkle = FixedMerkle(depth, [b'a'])
+    with pytest.raises(ValueError) as e:
+        merkle.create_membership_proof_at(2 ** depth)
+
+    assert str(e.value) == 'index should be lower than number of leaves'
+
+
+def test_create_membership_proofs_of_all_leaves():
+    leaves = [b'a', b'b', b'c']
+    merkle = FixedMerkle(2, leaves)
+    proofs = merkle.create_membership_proofs()
+
+    assert len(proofs) == len(leaves)
+    assert list(proofs.offsets) == [0, 64, 128]
+    assert bytes(proofs.buffer) == b''.join(merkle.create_membership_proof(leaf) for leaf in leaves)
+
+
+def test_create_membership_proofs_of_chosen_indices():
+    leaves = [b'a', b'b', b'c']
+    merkle = FixedMerkle(2, leaves)
+    proofs = merkle.create_membership_proofs([2, 3])
+
+    assert list(proofs.indices) == [2, 3]
+    assert proofs[0] == merkle.create_membership_proof(leaves[2])
+    assert proofs[1] == merkle.create_membership_proof(NULL_HASH)
+
+
+def test_create_membership_proofs_of_generated_indices():
+    merkle = FixedMerkle(2, [b'a', b'b', b'c'])
+    proofs = merkle.create_membership_proofs(index for index in [0, 2])
+
+    assert list(proofs.indices) == [0, 2]
+    assert bytes(proofs.buffer) == merkle.create_membership_proof_at(0) + merkle.create_membership_proof_at(2)
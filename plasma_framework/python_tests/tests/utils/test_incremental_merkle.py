@@ -0,0 +1,55 @@
+import pytest
+
+from plasma_core.block import Block, BlockBuilder
+from plasma_core.exceptions import BlockSealedException
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from plasma_core.utils.merkle.incremental_merkle import IncrementalMerkle
+
+
+@pytest.mark.parametrize("depth", [1, 2, 16])
+def test_empty_tree(depth):
+    assert IncrementalMerkle(depth).root == FixedMerkle(depth).root
+
+
+@pytest.mark.parametrize("num_leaves", [1, 2, 3, 5, 8])
+def test_root_matches_fixed_merkle(num_leaves):
+    depth = 3
+    leaves = [bytes([i]) for i in range(num_leaves)]
+    merkle = IncrementalMerkle(depth)
+
+    for i, leaf in enumerate(leaves):
+        merkle.append(leaf)
+        assert merkle.root == FixedMerkle(depth, leaves[:i + 1]).root
+
+
+def test_append_to_full_tree():
+    depth = 1
+    merkle = IncrementalMerkle(depth, [b'a', b'b'])
+
+    with pytest.raises(ValueError) as e:
+        merkle.append(b'c')
+
+    assert str(e.value) == 'number of leaves should be at most depth ** 2'
+
+
+def test_block_builder():
+    owner = b'\x01' * 20
+    transactions = [Transaction(outputs=[(owner, NULL_ADDRESS, amount)]) for amount in range(1, 4)]
+    builder = BlockBuilder(number=1000)
+
+    for tx in transactions:
+        builder.add_transaction(tx)
+
+    block = builder.seal()
+    assert block == Block(transactions, number=1000)
+    assert builder.root == block.root
+
+
+def test_block_builder_refuses_transactions_after_seal():
+    builder = BlockBuilder(number=1000)
+    builder.seal()
+
+    with pytest.raises(BlockSealedException):
+        builder.add_transaction(Transaction(outputs=[(b'\x01' * 20, NULL_ADDRESS, 1)]))
@@ -0,0 +1,27 @@
+import pytest
+from eth_utils import keccak as eth_keccak
+
+from plasma_core.utils import keccak
+from tests_utils.backends import restore_backend_fixture
+
+
+restore_backend = restore_backend_fixture(keccak)
+
+
+@pytest.mark.parametrize("backend", [name for name, _ in keccak.BACKENDS])
+def test_backend_matches_eth_utils(backend, restore_backend):
+    try:
+        keccak.use_backend(backend)
+    except ImportError:
+        pytest.skip(f'{backend} is not installed')
+
+    items = [b'', b'\x00' * 32, bytearray(b'abc'), memoryview(b'abcd')]
+    assert keccak.keccak_many(items) == [eth_keccak(bytes(item)) for item in items]
+    assert keccak.keccak(b'abc') == eth_keccak(b'abc')
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError) as e:
+        keccak.use_backend('sha256')
+
+    assert str(e.value) == 'unknown keccak backend: sha256'
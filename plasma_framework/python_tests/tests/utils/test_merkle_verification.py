@@ -0,0 +1,47 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from plasma_core.utils.merkle.verification import PARALLEL_THRESHOLD, is_valid, verify_proofs
+from plasma_core.utils.transactions import encode_utxo_id
+
+BLKNUM = 1000
+
+
+@pytest.fixture
+def block_proofs():
+    leaves = [i.to_bytes(4, 'big') for i in range(PARALLEL_THRESHOLD + 10)]
+    merkle = FixedMerkle(16, leaves)
+    proofs = [(leaf, encode_utxo_id(BLKNUM, txindex, 0), merkle.create_membership_proof_at(txindex))
+              for txindex, leaf in enumerate(leaves)]
+    return {BLKNUM: merkle.root}, proofs
+
+
+def test_verify_valid_and_invalid_proofs(block_proofs):
+    root_by_block, proofs = block_proofs
+    (leaf, position, proof) = proofs[1]
+    batch = [
+        proofs[0],
+        (b'not a leaf', position, proof),
+        (leaf, position + 1, proof),  # different output of the same transaction
+        (leaf, encode_utxo_id(BLKNUM + 1000, 1, 0), proof),  # unknown block
+        (leaf, position, proof[:-1]),
+        (leaf, position, b''),
+    ]
+
+    bitmap = verify_proofs(root_by_block, batch)
+
+    assert [is_valid(bitmap, i) for i in range(len(batch))] == [True, False, True, False, False, False]
+
+
+def test_verify_proofs_in_process_pool(block_proofs):
+    root_by_block, proofs = block_proofs
+    proofs[3] = (b'not a leaf', proofs[3][1], proofs[3][2])
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        bitmap = verify_proofs(root_by_block, proofs, executor=executor)
+        assert verify_proofs(root_by_block, proofs[:3], executor=executor) == verify_proofs(root_by_block, proofs[:3])
+
+    assert bitmap == verify_proofs(root_by_block, proofs)
+    assert [i for i in range(len(proofs)) if not is_valid(bitmap, i)] == [3]
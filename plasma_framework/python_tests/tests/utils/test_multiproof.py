@@ -0,0 +1,47 @@
+import pytest
+
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from plasma_core.utils.merkle.multiproof import Multiproof, check_multiproof, create_multiproof
+
+DEPTH = 4
+LEAVES = [bytes([i]) for i in range(11)]
+
+
+@pytest.fixture
+def merkle():
+    return FixedMerkle(DEPTH, LEAVES)
+
+
+@pytest.mark.parametrize("indices", [[0], [2, 3], [0, 5, 10], [10, 12], list(range(11))])
+def test_check_multiproof(merkle, indices):
+    multiproof = Multiproof.decode(create_multiproof(merkle, indices).encode())
+    leaves = [LEAVES[i] if i < len(LEAVES) else bytes(32) for i in multiproof.indices]
+
+    assert check_multiproof(leaves, merkle.root, multiproof, DEPTH)
+
+
+def test_multiproof_shares_siblings(merkle):
+    # leaves 2 and 3 are siblings, so only the nodes above them are needed
+    multiproof = create_multiproof(merkle, [2, 3])
+    assert multiproof.nodes == merkle.create_membership_proof_at(2)[32:]
+
+
+def test_single_leaf_multiproof_is_membership_proof(merkle):
+    assert create_multiproof(merkle, [5]).nodes == merkle.create_membership_proof_at(5)
+
+
+def test_check_multiproof_with_wrong_leaf(merkle):
+    multiproof = create_multiproof(merkle, [0, 5])
+    assert not check_multiproof([LEAVES[0], LEAVES[6]], merkle.root, multiproof, DEPTH)
+
+
+def test_check_multiproof_with_extra_node(merkle):
+    multiproof = create_multiproof(merkle, [0, 5])
+    multiproof = Multiproof(multiproof.indices, multiproof.nodes + bytes(32))
+    assert not check_multiproof([LEAVES[0], LEAVES[5]], merkle.root, multiproof, DEPTH)
+
+
+def test_check_multiproof_with_missing_node(merkle):
+    multiproof = create_multiproof(merkle, [0, 5])
+    multiproof = Multiproof(multiproof.indices, multiproof.nodes[:-32])
+    assert not check_multiproof([LEAVES[0], LEAVES[5]], merkle.root, multiproof, DEPTH)
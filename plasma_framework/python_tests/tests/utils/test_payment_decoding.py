@@ -0,0 +1,84 @@
+import random
+
+import pytest
+import rlp
+from rlp.codec import length_prefix
+from rlp.exceptions import DecodingError
+
+from plasma_core.block import Block
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+from plasma_core.utils.payment_decoding import LIST_OFFSET, LazyBlock, LazyTransaction, decode_block, decode_transaction
+from tests_utils.random_transactions import random_transaction
+
+OWNER = b'\x01' * 20
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_transaction_round_trip(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        tx = random_transaction(rng)
+        decoded = decode_transaction(tx.encoded)
+        assert decoded == tx
+        assert decoded.encoded == tx.encoded
+
+
+def test_lazy_transaction_fields():
+    tx = Transaction(inputs=[(1000, 2, 3), (2000, 0, 1)],
+                     outputs=[(OWNER, NULL_ADDRESS, 100), (OWNER, OWNER, 2 ** 200)],
+                     metadata=b'\x02' * 32)
+    lazy_tx = LazyTransaction(memoryview(tx.encoded))
+
+    assert lazy_tx.input_count == 2
+    assert lazy_tx.output_count == 2
+    assert lazy_tx.get_amount(1) == 2 ** 200
+    assert (lazy_tx.get_input(0).blknum, lazy_tx.get_input(0).txindex, lazy_tx.get_input(0).oindex) == (1000, 2, 3)
+    assert lazy_tx.get_output(1) == tx.outputs[1]
+    assert lazy_tx.metadata == tx.metadata
+    assert lazy_tx.encoded == tx.encoded
+
+
+def test_block_round_trip():
+    rng = random.Random(0)
+    block = Block([random_transaction(rng) for _ in range(20)], number=1000)
+    lazy_block = LazyBlock(block.encoded)
+
+    assert len(lazy_block) == 20
+    assert lazy_block.number == 1000
+    assert lazy_block.get_transaction(7).encoded == block.transactions[7].encoded
+    assert decode_block(block.encoded) == block
+
+
+def raw_transaction(tx_type=1, inputs=1, outputs=1, output_guard=OWNER, token=NULL_ADDRESS, metadata=b'\x00' * 32,
+                    encoded_tx_data=rlp.encode(0)):
+    """ Encodes a transaction field by field, so that it can break the Payment schema or canonical RLP """
+    payload = b''.join([rlp.encode(tx_type),
+                        rlp.encode([(1000000000000).to_bytes(32, 'big')] * inputs),
+                        rlp.encode([[1, [output_guard, token, 100]]] * outputs),
+                        encoded_tx_data,
+                        rlp.encode(metadata)])
+    return length_prefix(len(payload), LIST_OFFSET) + payload
+
+
+def test_raw_transaction_is_valid():
+    assert decode_transaction(raw_transaction()).encoded == raw_transaction()
+
+
+@pytest.mark.parametrize("data", [
+    b'',
+    b'\xc0',
+    b'\x80',
+    Transaction(inputs=[(1000, 0, 0)]).encoded[:-1],
+    Transaction(inputs=[(1000, 0, 0)]).encoded + b'\x00',
+    raw_transaction(tx_type=2),
+    raw_transaction(inputs=Transaction.NUM_INPUTS + 1),
+    raw_transaction(outputs=Transaction.NUM_OUTPUTS + 1),
+    raw_transaction(output_guard=OWNER[:19]),
+    raw_transaction(token=b'\x00' * 21),
+    raw_transaction(metadata=b'\x00' * 31),
+    raw_transaction(encoded_tx_data=b'\x81\x05'),
+])
+def test_decode_malformed_transaction(data):
+    with pytest.raises(DecodingError):
+        decode_transaction(data)
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+import rlp
+from eth_utils import to_checksum_address
+
+from plasma_core.transaction import Transaction
+from plasma_core.utils.payment_encoding import encode_transaction, encode_transactions
+from tests_utils.random_transactions import random_transaction
+
+RANDOM_TRANSACTIONS = 500
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_encoding_matches_rlp(seed):
+    rng = random.Random(seed)
+    for _ in range(RANDOM_TRANSACTIONS):
+        tx = random_transaction(rng)
+        assert encode_transaction(tx) == rlp.encode(tx, Transaction)
+        assert tx.encoded == rlp.encode(tx, Transaction)
+
+
+def test_too_many_inputs_fall_back_to_rlp():
+    tx = Transaction(inputs=[(1, 0, 0)] * (Transaction.NUM_INPUTS + 1))
+
+    with pytest.raises(ValueError):
+        encode_transaction(tx)
+    with pytest.raises(rlp.exceptions.ListSerializationError):
+        tx.encoded
+
+
+def columns_of(transactions):
+    input_offsets, output_offsets = [0], [0]
+    positions, owners, tokens, amounts = [], [], [], []
+    for tx in transactions:
+        positions.extend(tx_input.identifier for tx_input in tx.inputs)
+        owners.extend(to_checksum_address(output.output_guard) for output in tx.outputs)
+        tokens.extend(output.token for output in tx.outputs)
+        amounts.extend(output.amount for output in tx.outputs)
+        input_offsets.append(len(positions))
+        output_offsets.append(len(amounts))
+    return input_offsets, positions, output_offsets, owners, tokens, amounts
+
+
+def test_bulk_encoding_matches_transactions():
+    rng = random.Random(0)
+    transactions = []
+    for _ in range(RANDOM_TRANSACTIONS):
+        tx = random_transaction(rng)
+        transactions.append(Transaction(inputs=[(i.blknum, i.txindex, i.oindex) for i in tx.inputs],
+                                        outputs=[(o.output_guard, o.token, o.amount) for o in tx.outputs]))
+
+    encoded = list(encode_transactions(*columns_of(transactions)))
+
+    assert encoded == [(tx.encoded, tx.hash) for tx in transactions]
+
+
+def test_bulk_encoding_rejects_too_many_outputs():
+    tx = Transaction(outputs=[(b'\x01' * 20, b'\x00' * 20, 1)] * Transaction.NUM_OUTPUTS)
+    input_offsets, positions, output_offsets, owners, tokens, amounts = columns_of([tx])
+
+    with pytest.raises(ValueError):
+        list(encode_transactions(input_offsets, positions, output_offsets, owners, tokens, amounts, max_outputs=4))
@@ -0,0 +1,61 @@
+import pytest
+
+from plasma_core.account import EthereumAccount
+from plasma_core.block import Block
+from plasma_core.child_chain import ChildChain
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+from plasma_core.utils.merkle.fixed_merkle import FixedMerkle
+from plasma_core.utils.merkle.proof_store import MerkleProofStore
+
+
+@pytest.fixture
+def proof_store(tmp_path):
+    with MerkleProofStore(str(tmp_path)) as store:
+        yield store
+
+
+@pytest.mark.parametrize("num_leaves", [0, 1, 3, 8])
+def test_proofs_match_fixed_merkle(proof_store, num_leaves):
+    depth = 3
+    merkle = FixedMerkle(depth, [bytes([i]) for i in range(num_leaves)])
+    proof_store.write(1000, merkle)
+
+    assert proof_store.root(1000) == merkle.root
+    for index in range(2 ** depth):
+        assert proof_store.create_membership_proof_at(1000, index) == merkle.create_membership_proof_at(index)
+
+
+def test_overwrite_block(proof_store):
+    proof_store.write(1000, FixedMerkle(2, [b'a']))
+    proof_store.root(1000)
+    merkle = FixedMerkle(2, [b'b'])
+    proof_store.write(1000, merkle)
+
+    assert proof_store.root(1000) == merkle.root
+
+
+def test_missing_block(proof_store):
+    assert 1000 not in proof_store
+    with pytest.raises(KeyError):
+        proof_store.root(1000)
+
+
+def test_keeps_bounded_number_of_open_files(tmp_path):
+    with MerkleProofStore(str(tmp_path), max_open_files=2) as store:
+        merkles = [FixedMerkle(2, [bytes([blknum])]) for blknum in range(4)]
+        for blknum, merkle in enumerate(merkles):
+            store.write(blknum, merkle)
+            assert store.root(blknum) == merkle.root
+
+        assert list(store._open_trees) == [2, 3]
+        assert store.root(0) == merkles[0].root
+
+
+def test_child_chain_writes_added_blocks(proof_store):
+    child_chain = ChildChain(EthereumAccount(NULL_ADDRESS, None), proof_store=proof_store)
+    deposit = Block([Transaction(outputs=[(b'\x01' * 20, NULL_ADDRESS, 100)])], number=1)
+
+    assert child_chain.add_block(deposit)
+    assert proof_store.root(1) == deposit.root
+    assert proof_store.create_membership_proof_at(1, 0) == deposit.merklized_transaction_set.create_membership_proof_at(0)
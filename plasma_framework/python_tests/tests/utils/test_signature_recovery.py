@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from eth_keys.datatypes import PrivateKey
+
+from plasma_core.account import EthereumAccount
+from plasma_core.block import Block
+from plasma_core.child_chain import ChildChain
+from plasma_core.constants import NULL_ADDRESS, NULL_SIGNATURE
+from plasma_core.transaction import Transaction
+from plasma_core.utils.eip712_struct_hash import hash_struct
+from plasma_core.utils import ecdsa, signature_recovery
+from plasma_core.utils.signature_recovery import SignerRecovery, recover_signers
+
+VERIFYING_CONTRACT = '0x44de0ec539b8c4a4b530c78620fe8320167f2f74'
+KEYS = [PrivateKey(bytes([i]) * 32) for i in range(1, 4)]
+OPERATOR, ALICE, BOB = [EthereumAccount(key.public_key.to_checksum_address(), key) for key in KEYS]
+
+
+def signed_transaction(amount, account):
+    tx = Transaction(inputs=[(1000, 0, 0)], outputs=[(NULL_ADDRESS, NULL_ADDRESS, amount)])
+    tx.sign(0, account, verifying_contract=VERIFYING_CONTRACT)
+    return tx
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    monkeypatch.setitem(signature_recovery.PARALLEL_THRESHOLDS, ecdsa.backend, 4)
+    monkeypatch.setitem(signature_recovery.CHUNK_SIZES, ecdsa.backend, 2)
+
+
+def signed_pairs(count):
+    transactions = [signed_transaction(i, [ALICE, BOB][i % 2]) for i in range(count)]
+    return [(hash_struct(tx, verifying_contract=VERIFYING_CONTRACT), tx.signatures[0]) for tx in transactions], \
+        [tx.signers[0] for tx in transactions]
+
+
+def test_recovered_signers_match_signing_keys():
+    pairs, signers = signed_pairs(3)
+
+    assert recover_signers(pairs) == signers
+
+
+def test_recovery_on_executor(small_batches):
+    pairs, signers = signed_pairs(7)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert recover_signers(pairs, executor=executor) == signers
+        assert recover_signers(pairs[:3], executor=executor) == signers[:3]
+
+
+def test_null_and_invalid_signatures_recover_to_null_address():
+    msg_hash = b'\x01' * 32
+    pairs = [(msg_hash, NULL_SIGNATURE), (msg_hash, b'\x00' * 64 + b'\x01'), (msg_hash, b'\xff' * 65), (msg_hash, b'')]
+
+    assert recover_signers(pairs) == [NULL_ADDRESS] * len(pairs)
+
+
+def test_recovery_groups_signers_by_transaction():
+    tx = Transaction(inputs=[(1000, 0, 0), (1000, 0, 1)])
+    tx.sign(0, ALICE, verifying_contract=VERIFYING_CONTRACT)
+    tx.sign(1, BOB, verifying_contract=VERIFYING_CONTRACT)
+    deposit = Transaction(outputs=[(ALICE.address, NULL_ADDRESS, 1)])
+
+    signers = SignerRecovery(VERIFYING_CONTRACT).recover_transactions([tx, deposit])
+
+    assert signers == [tx.signers, []]
+
+
+@pytest.mark.parametrize("signer_recovery", [None, SignerRecovery(VERIFYING_CONTRACT)])
+def test_child_chain_validates_recovered_signers(signer_recovery):
+    child_chain = ChildChain(OPERATOR, signer_recovery=signer_recovery)
+    assert child_chain.add_block(Block([Transaction(outputs=[(ALICE.address, NULL_ADDRESS, 100)])], number=1))
+
+    # signed by bob, but claims alice as its signer
+    tx = Transaction(inputs=[(1, 0, 0)], outputs=[(BOB.address, NULL_ADDRESS, 100)])
+    tx.sign(0, BOB, verifying_contract=VERIFYING_CONTRACT)
+    tx.signers[0] = bytes.fromhex(ALICE.address[2:])
+    block = Block([tx], number=1000).sign(OPERATOR.key)
+
+    assert child_chain.add_block(block) == (signer_recovery is None)
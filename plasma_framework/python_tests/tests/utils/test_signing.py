@@ -0,0 +1,44 @@
+import random
+
+import pytest
+from eth_keys.datatypes import PrivateKey
+
+from plasma_core.account import EthereumAccount
+from plasma_core.transaction import Transaction
+from plasma_core.utils.signing import sign_many
+
+VERIFYING_CONTRACT = '0x44de0ec539b8c4a4b530c78620fe8320167f2f74'
+KEYS = [PrivateKey(bytes([i]) * 32) for i in range(1, 4)]
+ACCOUNTS = [EthereumAccount(key.public_key.to_checksum_address(), key) for key in KEYS]
+
+
+def make_transactions(count):
+    rng = random.Random(0)
+    transactions, accounts = [], []
+    for _ in range(count):
+        inputs = [(rng.randint(1, 100) * 1000, rng.randint(0, 10), 0) for _ in range(rng.randint(1, 3))]
+        transactions.append(Transaction(inputs=inputs, outputs=[(ACCOUNTS[0].address, b'\x00' * 20, rng.randint(1, 100))]))
+        accounts.append([rng.choice(ACCOUNTS) for _ in inputs])
+    return transactions, accounts
+
+
+@pytest.mark.parametrize("workers,processes", [(None, False), (4, False), (2, True)])
+def test_signatures_match_serial_signing(workers, processes):
+    transactions, accounts = make_transactions(40)
+    expected, _ = make_transactions(40)
+    for tx, tx_accounts in zip(expected, accounts):
+        for index, account in enumerate(tx_accounts):
+            tx.sign(index, account, verifying_contract=VERIFYING_CONTRACT)
+
+    signed = sign_many(transactions, accounts, VERIFYING_CONTRACT, workers=workers, processes=processes)
+
+    assert signed == transactions
+    for tx, expected_tx, tx_accounts in zip(transactions, expected, accounts):
+        assert tx.signatures == expected_tx.signatures
+        assert tx.signers == [bytes.fromhex(account.address[2:]) for account in tx_accounts]
+
+
+def test_every_transaction_needs_accounts():
+    transactions, accounts = make_transactions(2)
+    with pytest.raises(ValueError):
+        sign_many(transactions, accounts[:1])
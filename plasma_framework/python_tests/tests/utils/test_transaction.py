@@ -0,0 +1,39 @@
+import pytest
+from eth_utils import keccak
+
+from plasma_core.constants import NULL_ADDRESS
+from plasma_core.transaction import Transaction
+
+OWNER = b'\x01' * 20
+
+
+@pytest.fixture
+def tx():
+    return Transaction(inputs=[(1000, 0, 0)], outputs=[(OWNER, NULL_ADDRESS, 100)])
+
+
+def test_encoding_and_hash_are_cached(tx):
+    assert tx.encoded is tx.encoded
+    assert tx.hash is tx.hash
+    assert tx.hash == keccak(tx.encoded)
+
+
+def test_mutating_input_is_refused(tx):
+    with pytest.raises(AttributeError):
+        tx.inputs[0].blknum = 2000
+
+
+@pytest.mark.parametrize("field, value", [
+    ('inputs', []),
+    ('outputs', []),
+    ('metadata', b'\x01' * 32),
+])
+def test_mutating_encoded_fields_is_refused(tx, field, value):
+    with pytest.raises(AttributeError):
+        setattr(tx, field, value)
+
+
+def test_signing_does_not_change_hash(tx):
+    tx_hash = tx.hash
+    tx.signatures[0] = b'\x01' * 65
+    assert tx.hash == tx_hash == Transaction(inputs=[(1000, 0, 0)], outputs=[(OWNER, NULL_ADDRESS, 100)]).hash